@@ -2,22 +2,36 @@
 agents/__init__.py
 Agents 패키지 초기화 및 공개 API
 """
-from .base import AgentState, EVALUATION_CRITERIA, llm, extract_score, get_web_context
-from .technology_agent import technology_agent
-from .learning_effectiveness_agent import learning_effectiveness_agent
+from .base import (
+    AgentState, EVALUATION_CRITERIA, EVALUATION_CHECKLIST_STR, CategoryScore, llm, extract_score,
+    get_web_context, aget_web_context, ainvoke_llm, astream_llm, arun_workflow, tavily_search,
+    stream_score, astream_score,
+)
+from .eval_agent import make_eval_agent, technology_agent, learning_effectiveness_agent, growth_potential_agent
 from .market_agent import market_agent
 from .competition_agent import competition_agent
-from .growth_potential_agent import growth_potential_agent
 from .risk_agent import risk_agent
 from .judge_agent import comprehensive_judge_agent
 from .report_agent import report_generation_agent
+from .quick_score_agent import quick_score_agent
+from .evaluate_all_agent import evaluate_all_agent
 
 __all__ = [
     "AgentState",
     "EVALUATION_CRITERIA",
+    "EVALUATION_CHECKLIST_STR",
+    "CategoryScore",
     "llm",
     "extract_score",
     "get_web_context",
+    "aget_web_context",
+    "ainvoke_llm",
+    "astream_llm",
+    "arun_workflow",
+    "tavily_search",
+    "stream_score",
+    "astream_score",
+    "make_eval_agent",
     "technology_agent",
     "learning_effectiveness_agent",
     "market_agent",
@@ -26,4 +40,6 @@ __all__ = [
     "risk_agent",
     "comprehensive_judge_agent",
     "report_generation_agent",
+    "quick_score_agent",
+    "evaluate_all_agent",
 ]
\ No newline at end of file
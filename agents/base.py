@@ -4,11 +4,41 @@ agents/base.py
 """
 import os
 import re
+import asyncio
+import weakref
+import json
+import time
+import shelve
+import hashlib
+import threading
+import warnings
 import requests
-from typing import TypedDict, Literal, Annotated
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import TypedDict, Literal, Annotated, Optional, Tuple
 import operator
+from collections import OrderedDict
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from langchain.embeddings import CacheBackedEmbeddings
+from langchain.storage import LocalFileStore
+from langchain_core.globals import set_llm_cache
+from langchain_core._api import LangChainBetaWarning
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from langchain_core.pydantic_v1 import BaseModel, Field, validator
+from langchain_community.cache import SQLiteCache
+try:
+    from langchain_tavily import TavilySearch
+except ImportError:
+    from langchain_community.tools.tavily_search import TavilySearchResults as TavilySearch
+
+# 빠른 JSON 파서 (선택적 import, 없으면 표준 json 사용)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # .env 파일 로드 (override=True로 강제 리로드)
 load_dotenv(override=True)
@@ -41,6 +71,7 @@ class AgentState(TypedDict, total=False):
     market_score: Annotated[int, keep_first_value]
     competition_score: Annotated[int, keep_first_value]
     risk_score: Annotated[int, keep_first_value]
+    quick_score: Annotated[int, keep_first_value]
     
     # 판단 및 경로
     final_judge: Annotated[Literal["투자", "보류"], keep_first_value]
@@ -55,6 +86,15 @@ class AgentState(TypedDict, total=False):
     report: Annotated[str, keep_first_value]
 
 
+# risk_agent는 risk_score를 0~10 스케일로 저장 (나머지 점수는 0~100)
+RISK_SCORE_SCALE = 10
+
+
+def risk_score_100(state: AgentState) -> int:
+    """리스크 점수를 다른 항목과 같은 100점 기준으로 환산 (종합 판단/보고서 공용)"""
+    return state["risk_score"] * RISK_SCORE_SCALE
+
+
 # ========================================
 # 평가 기준 정의
 # ========================================
@@ -135,76 +175,439 @@ EVALUATION_CRITERIA = {
 }
 
 
+# 프롬프트용 체크리스트 문자열 (한 번만 생성 - 매 호출 프롬프트가 동일해 OpenAI 프롬프트 캐시에도 유리)
+EVALUATION_CHECKLIST_STR = {
+    key: "\n".join(f"{i+1}. {q}" for i, q in enumerate(questions))
+    for key, questions in EVALUATION_CRITERIA.items()
+}
+
+# 분석 Agent 프롬프트 공통 머리말 (고정 문구)
+# OpenAI 프롬프트 캐시는 가장 긴 공통 접두사 기준이므로 모든 분석 Agent가 이 문구로 시작하고,
+# 스타트업 이름/참고 자료처럼 매번 바뀌는 값은 프롬프트 맨 뒤에 둠
+_BASE_PROMPT_PREFIX = """당신은 교육 스타트업 투자 심사역입니다.
+아래 평가 기준의 각 항목을 0-10점으로 채점하고, 참고 자료에 근거해 판단하세요.
+
+**출력 형식:**
+- evidence: 각 항목별 점수(0-10점)와 근거 (URL 포함)
+- score: 항목 점수의 합계 (0-100)
+"""
+
+
+# ========================================
+# 구조화 출력 스키마
+# ========================================
+
+class CategoryScore(BaseModel):
+    """평가 영역 하나의 결과"""
+    score: int = Field(description="평가 기준 항목 점수(각 0-10점)의 합계, 0-100")
+    evidence: str = Field(description="항목별 점수와 근거 (가능하면 URL 포함)")
+    
+    @validator("score")
+    def _clamp_score(cls, score: int) -> int:
+        return min(100, max(0, score))
+
+
 # ========================================
 # LLM 초기화
 # ========================================
 
-llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+# CACHE_DISABLE=1 이면 LLM/웹 검색 캐시를 모두 끔 (벤치마크용)
+CACHE_DISABLED = os.getenv("CACHE_DISABLE") == "1"
+
+# 동일 프롬프트 재실행 시 LLM 호출 생략 (프롬프트 + 모델 설정 완전 일치 기준)
+if not CACHE_DISABLED:
+    set_llm_cache(SQLiteCache(database_path=os.getenv("LLM_CACHE_PATH", ".llm_cache.db")))
+
+# 모든 Agent가 공유하는 단일 LLM 인스턴스 (api.openai.com 연결 풀 재사용)
+_OPENAI_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+# LLM 동시 호출 상한 (OpenAI 레이트 리밋 보호)
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "6"))
+
+# 분당 요청 한도 (계정 RPM보다 약간 낮게 설정 - 429 후 백오프 재시도 대신 미리 간격을 둬 처리량 유지)
+# ChatOpenAI(rate_limiter=...)는 async 호출에서도 블로킹 acquire를 써 이벤트 루프를 멈추므로
+# ainvoke_llm 등 비동기 호출 지점에서 aacquire로 직접 사용
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_RPM", "450"))
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", LangChainBetaWarning)  # InMemoryRateLimiter는 beta API
+    LLM_RATE_LIMITER = InMemoryRateLimiter(
+        requests_per_second=LLM_REQUESTS_PER_MINUTE / 60,
+        check_every_n_seconds=0.05,
+        max_bucket_size=LLM_MAX_CONCURRENCY,
+    )
+
+llm = ChatOpenAI(
+    model="gpt-4o-mini",
+    temperature=0,
+    http_client=httpx.Client(limits=_OPENAI_LIMITS),
+    http_async_client=httpx.AsyncClient(limits=_OPENAI_LIMITS),
+)
+
+# 임베딩 모델 / 차원 (text-embedding-3-small은 256차원으로 줄여도 검색 품질이 거의 유지됨)
+EMBED_MODEL = "text-embedding-3-small"
+EMBED_DIMENSIONS = 256
+
+# 임베딩 요청 1회당 최대 입력 수 / 일시적 오류(429, 5xx) 재시도 횟수
+EMBED_BATCH_SIZE = 1000
+EMBED_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "6"))
+
+# 청크 단위 요청 대신 최대 EMBED_BATCH_SIZE개씩 배열 입력으로 한 번에 임베딩
+_EMBEDDINGS = OpenAIEmbeddings(
+    model=EMBED_MODEL,
+    dimensions=EMBED_DIMENSIONS,
+    chunk_size=EMBED_BATCH_SIZE,
+    max_retries=EMBED_MAX_RETRIES,
+)
+
+# 같은 텍스트/검색어의 임베딩은 디스크에 저장해 재실행 시 API 호출 생략
+# (모델/차원이 바뀌면 벡터가 호환되지 않으므로 namespace로 분리)
+if CACHE_DISABLED:
+    SHARED_EMBEDDINGS = _EMBEDDINGS
+else:
+    SHARED_EMBEDDINGS = CacheBackedEmbeddings.from_bytes_store(
+        _EMBEDDINGS,
+        LocalFileStore(os.getenv("EMBED_CACHE_DIR", ".embed_cache")),
+        namespace=f"{EMBED_MODEL}-{EMBED_DIMENSIONS}",
+        batch_size=EMBED_BATCH_SIZE,
+        query_embedding_cache=True,
+    )
 
 
 # ========================================
 # 유틸리티 함수
 # ========================================
 
+# 웹 검색 API용 공유 세션 (Agent 간 TCP/TLS 연결 재사용)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+# 총점 헤더 패턴 (**총점** / 총점 / Score)
+_TOTAL_PATTERN = re.compile(r"(?:\*\*총점\*\*|총점|Score)[:：]?\s*(\d{1,3})", re.IGNORECASE)
+
+# 개별 항목(항목 번호, 점수) 패턴 - 총점이 없을 때만 사용하며 한 번의 finditer로 모든 항목을 훑음
+# 점수가 다음 줄에 있어도 되지만("1.\n점수: 8/10") 최대 200자, 다음 항목 번호 앞까지만 탐색
+_ITEM_PATTERN = re.compile(
+    r"(?<!\d)(?P<item_num>\d{1,2})\.\s"
+    r"(?:(?!\d{1,2}\.\s)[\s\S]){0,200}?"
+    r"(?P<item_score>\d{1,2})\s*(?:/\s*10|점)"
+)
+
+
 def extract_score(analysis: str) -> int:
-    """분석 텍스트에서 점수 추출"""
-    patterns = [
-        r"\*\*총점\*\*[:：]?\s*(\d{1,3})",
-        r"총점[:：]?\s*(\d{1,3})\s*(?:점|/100)?",
-        r"Score[:：]?\s*(\d{1,3})",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, analysis, re.IGNORECASE)
-        if match:
-            score = int(match.group(1))
-            return min(100, max(0, score))
-    
-    # 개별 항목 점수 합산
-    total = 0
-    for i in range(1, 11):
-        item_match = re.search(fr"{i}\.\s.*?(\d{{1,2}})\s*(?:/\s*10|점)", analysis, re.DOTALL)
-        if item_match:
-            total += int(item_match.group(1))
+    """
+    분석 텍스트에서 점수 추출 (총점이 있으면 총점, 없으면 항목 점수 합산)
+
+    >>> extract_score("1. 기술력: 8/10\\n2. 팀: 7/10\\n3. 종합 평가 - 총점: 72점")
+    72
+    >>> extract_score("1. 기술력: 8/10\\n2. 팀: 7점")
+    15
+    >>> extract_score("1. 기술력\\n점수: 8/10\\n2. 팀\\n점수: 7/10")
+    15
+    >>> extract_score("1.\\n점수: 8/10\\n2.\\n점수: 6점")
+    14
+    >>> extract_score("1. 기술력 (근거 부족)\\n2. 팀: 7/10")
+    7
+    """
+    # 총점 헤더가 어디에 있든 항목 점수보다 우선 (번호 달린 줄 안의 총점이 항목으로 합산되지 않도록)
+    total_match = _TOTAL_PATTERN.search(analysis)
+    if total_match:
+        return min(100, max(0, int(total_match.group(1))))
+    
+    # 개별 항목(1~10번) - 같은 번호가 반복되면 처음 나온 점수만 사용
+    item_scores = {}
+    for match in _ITEM_PATTERN.finditer(analysis):
+        num = int(match.group("item_num"))
+        if 1 <= num <= 10:
+            item_scores.setdefault(num, int(match.group("item_score")))
     
+    total = sum(item_scores.values())
     return min(100, max(0, total))
 
 
-def get_web_context(startup_name: str, query: str) -> str:
-    """웹 검색으로 컨텍스트 수집"""
+def stream_score(chain, inputs: dict) -> Tuple[int, str]:
+    """
+    스트리밍 응답에서 총점이 확정되는 즉시 생성을 중단
+    반환: (점수, 중단 시점까지 수신한 텍스트)
+    """
+    buffer = ""
+    stream = chain.stream(inputs)
+    try:
+        for chunk in stream:
+            buffer += chunk.content
+            match = _TOTAL_PATTERN.search(buffer)
+            # 숫자 뒤에 다른 문자가 도착해야 점수가 끝까지 수신된 것으로 봄
+            if match and match.end(1) < len(buffer):
+                return min(100, max(0, int(match.group(1)))), buffer
+    finally:
+        # 스트림을 닫으면 응답 연결이 끊겨 서버 측 토큰 생성도 중단됨
+        stream.close()
+    
+    return extract_score(buffer), buffer
+
+
+async def astream_score(chain, inputs: dict) -> Tuple[int, str]:
+    """
+    stream_score의 비동기 버전 (astream_llm으로 동시 호출 수/요청 속도 제한 적용)
+    반환: (점수, 중단 시점까지 수신한 텍스트)
+    """
+    buffer = ""
+    stream = astream_llm(chain, inputs)
+    try:
+        async for chunk in stream:
+            buffer += chunk.content
+            match = _TOTAL_PATTERN.search(buffer)
+            if match and match.end(1) < len(buffer):
+                return min(100, max(0, int(match.group(1)))), buffer
+    finally:
+        # 스트림을 닫으면 응답 연결이 끊겨 서버 측 토큰 생성도 중단되고 세마포어도 바로 반환됨
+        await stream.aclose()
+    
+    return extract_score(buffer), buffer
+
+
+def tavily_search(query: str, max_results: int = 10) -> str:
+    """
+    TavilySearch 결과를 컨텍스트 문자열로 변환
+    (동일 쿼리는 WEB_CACHE_TTL 동안 웹 검색 메모리 + 디스크 캐시에서 재사용)
+    실패 시 예외를 그대로 올려 캐시에 남지 않도록 함
+    """
+    # 재실행(성능 비교 등)에서도 같은 쿼리는 네트워크를 타지 않도록 웹 검색 캐시 공유
+    key = _web_cache_key("tavily_search", f"{query}|{max_results}")
+    cached = _web_cache_get(key)
+    if cached is not None:
+        return cached
+    
+    result = _tavily_search(query, max_results)
+    if result:
+        _web_cache_set(key, result)
+    return result
+
+
+def _tavily_search(query: str, max_results: int) -> str:
+    results = TavilySearch(max_results=max_results).invoke(query)
+    # TavilySearch는 문자열을 직접 반환하거나 리스트를 반환할 수 있음
+    if isinstance(results, str):
+        return results
+    if isinstance(results, list):
+        return "\n".join([f"- {r.get('title', r.get('content', str(r)))}" for r in results])
+    return str(results)
+
+
+def _tavily_request(startup_name: str, query: str) -> Optional[dict]:
+    """Tavily API 요청 인자 (API 키가 없으면 None)"""
     tavily_key = os.getenv("TAVILY_API_KEY")
+    if not tavily_key:
+        return None
+    return {
+        "url": "https://api.tavily.com/search",
+        "params": {"query": f"{startup_name} {query}", "limit": 5},
+        "headers": {"Authorization": f"Bearer {tavily_key}"},
+    }
+
+
+def _naver_request(startup_name: str, query: str) -> Optional[dict]:
+    """Naver News API 요청 인자 (API 키가 없으면 None)"""
     naver_id = os.getenv("NAVER_CLIENT_ID")
     naver_secret = os.getenv("NAVER_CLIENT_SECRET")
+    if not (naver_id and naver_secret):
+        return None
+    return {
+        "url": "https://openapi.naver.com/v1/search/news.json",
+        "params": {"query": f"{startup_name} {query}", "display": 5},
+        "headers": {"X-Naver-Client-Id": naver_id, "X-Naver-Client-Secret": naver_secret},
+    }
+
+
+def _format_tavily(content: bytes) -> Optional[str]:
+    """Tavily API 응답을 컨텍스트 문자열로 변환"""
+    items = _json_loads(content).get("results", [])
+    if items:
+        return "[Tavily 검색]\n" + "\n".join(
+            f"- {it.get('title')} ({it.get('url')})" for it in items
+        )
+    return None
+
+
+def _format_naver(content: bytes) -> Optional[str]:
+    """Naver News API 응답을 컨텍스트 문자열로 변환"""
+    items = _json_loads(content).get("items", [])
+    if items:
+        return "[Naver 뉴스]\n" + "\n".join(
+            f"- {it.get('title')} ({it.get('originallink')})" for it in items
+        )
+    return None
+
+
+def _fetch(request: Optional[dict], formatter) -> Optional[str]:
+    """웹 검색 API 동기 호출 (실패 시 None)"""
+    if request is None:
+        return None
+    try:
+        res = _SESSION.get(request["url"], params=request["params"], headers=request["headers"], timeout=10)
+        return formatter(res.content)
+    except:
+        return None
+
+
+async def _afetch(client: httpx.AsyncClient, request: Optional[dict], formatter) -> Optional[str]:
+    """웹 검색 API 비동기 호출 (실패 시 None)"""
+    if request is None:
+        return None
+    try:
+        res = await client.get(request["url"], params=request["params"], headers=request["headers"])
+        return formatter(res.content)
+    except:
+        return None
+
+
+# 웹 검색 API용 공유 비동기 클라이언트 (이벤트 루프별 1개, Agent 간 keep-alive 연결 재사용)
+_WEB_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_ASYNC_CLIENTS = weakref.WeakKeyDictionary()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """현재 이벤트 루프의 공유 httpx.AsyncClient (처음 호출 시 생성)"""
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        client = _ASYNC_CLIENTS[loop] = httpx.AsyncClient(limits=_WEB_LIMITS, timeout=10)
+    return client
+
+
+async def aclose_async_client() -> None:
+    """현재 이벤트 루프의 공유 클라이언트 종료 (루프 종료 전에 호출)"""
+    client = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def arun_workflow(graph, state: dict) -> dict:
+    """컴파일된 워크플로우를 비동기로 실행하고 공유 클라이언트 정리"""
+    try:
+        return await graph.ainvoke(state)
+    finally:
+        await aclose_async_client()
+
+
+# 웹 검색 결과 디스크 캐시 (뉴스성 쿼리이므로 기본 1시간 유지)
+WEB_CACHE_PATH = os.getenv("WEB_CACHE_PATH", ".web_cache")
+WEB_CACHE_TTL = int(os.getenv("WEB_CACHE_TTL", "3600"))
+_WEB_CACHE_LOCK = threading.Lock()  # shelve는 동시 접근을 지원하지 않음
+
+# 1차 메모리 캐시 (프로세스 내 반복 조회는 디스크를 열지 않음)
+WEB_MEMORY_CACHE_SIZE = 512
+_WEB_MEMORY_CACHE = OrderedDict()
+
+
+def _web_cache_key(startup_name: str, query: str) -> str:
+    return hashlib.sha256(f"{startup_name}|{query}".encode("utf-8")).hexdigest()
+
+
+def _remember(key: str, entry: tuple) -> None:
+    # 호출부에서 _WEB_CACHE_LOCK을 잡은 상태로 사용
+    _WEB_MEMORY_CACHE[key] = entry
+    _WEB_MEMORY_CACHE.move_to_end(key)
+    if len(_WEB_MEMORY_CACHE) > WEB_MEMORY_CACHE_SIZE:
+        _WEB_MEMORY_CACHE.popitem(last=False)
+
+
+def _web_cache_get(key: str) -> Optional[str]:
+    """TTL 이내의 캐시된 컨텍스트 반환 (메모리 → 디스크 순서, 없거나 만료되면 None)"""
+    if CACHE_DISABLED:
+        return None
+    
+    with _WEB_CACHE_LOCK:
+        cached = _WEB_MEMORY_CACHE.get(key)
+        if cached is None:
+            with shelve.open(WEB_CACHE_PATH) as cache:
+                cached = cache.get(key)
+            if cached:
+                _remember(key, cached)
+    if cached and time.time() - cached[0] < WEB_CACHE_TTL:
+        return cached[1]
+    return None
+
+
+# 웹 검색 결과가 하나도 없을 때의 컨텍스트
+NO_SEARCH_RESULTS = "검색 결과 없음"
+
+
+def _web_cache_set(key: str, context: str) -> None:
+    # 검색 실패/결과 없음은 캐시하지 않음 (API 키 설정 후 바로 재시도 가능)
+    if CACHE_DISABLED or context == NO_SEARCH_RESULTS:
+        return
+    
+    entry = (time.time(), context)
+    with _WEB_CACHE_LOCK:
+        _remember(key, entry)
+        with shelve.open(WEB_CACHE_PATH) as cache:
+            cache[key] = entry
+
+
+def _join_contexts(contexts) -> str:
+    # Tavily → Naver 순서 유지
+    contexts = [ctx for ctx in contexts if ctx]
+    return "\n\n".join(contexts) if contexts else NO_SEARCH_RESULTS
+
+
+def get_web_context(startup_name: str, query: str) -> str:
+    """웹 검색으로 컨텍스트 수집 (Tavily, Naver 동시 요청, WEB_CACHE_TTL 동안 디스크 캐시)"""
+    key = _web_cache_key(startup_name, query)
+    cached = _web_cache_get(key)
+    if cached is not None:
+        return cached
     
-    contexts = []
-    
-    # Tavily API
-    if tavily_key:
-        try:
-            url = "https://api.tavily.com/search"
-            params = {"query": f"{startup_name} {query}", "limit": 5}
-            headers = {"Authorization": f"Bearer {tavily_key}"}
-            res = requests.get(url, params=params, headers=headers, timeout=10)
-            items = res.json().get("results", [])
-            if items:
-                contexts.append("[Tavily 검색]\n" + "\n".join(
-                    f"- {it.get('title')} ({it.get('url')})" for it in items
-                ))
-        except:
-            pass
-    
-    # Naver News API
-    if naver_id and naver_secret:
-        try:
-            url = "https://openapi.naver.com/v1/search/news.json"
-            headers = {"X-Naver-Client-Id": naver_id, "X-Naver-Client-Secret": naver_secret}
-            params = {"query": f"{startup_name} {query}", "display": 5}
-            res = requests.get(url, params=params, headers=headers, timeout=10)
-            items = res.json().get("items", [])
-            if items:
-                contexts.append("[Naver 뉴스]\n" + "\n".join(
-                    f"- {it.get('title')} ({it.get('originallink')})" for it in items
-                ))
-        except:
-            pass
-    
-    return "\n\n".join(contexts) if contexts else "검색 결과 없음"
\ No newline at end of file
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(_fetch, _tavily_request(startup_name, query), _format_tavily),
+            executor.submit(_fetch, _naver_request(startup_name, query), _format_naver),
+        ]
+        context = _join_contexts(future.result() for future in futures)
+    
+    _web_cache_set(key, context)
+    return context
+
+
+async def aget_web_context(startup_name: str, query: str) -> str:
+    """get_web_context의 비동기 버전 (이벤트 루프를 막지 않음)"""
+    key = _web_cache_key(startup_name, query)
+    # 캐시 조회/저장은 threading.Lock + shelve 디스크 I/O라 스레드에서 실행
+    # (다른 스레드가 락을 잡고 있어도 병렬 실행 중인 다른 Agent 노드가 멈추지 않도록)
+    cached = await asyncio.to_thread(_web_cache_get, key)
+    if cached is not None:
+        return cached
+    
+    client = get_async_client()
+    context = _join_contexts(await asyncio.gather(
+        _afetch(client, _tavily_request(startup_name, query), _format_tavily),
+        _afetch(client, _naver_request(startup_name, query), _format_naver),
+    ))
+    
+    await asyncio.to_thread(_web_cache_set, key, context)
+    return context
+
+
+_LLM_SEMAPHORES = weakref.WeakKeyDictionary()  # 이벤트 루프별 세마포어
+
+
+def llm_semaphore() -> asyncio.Semaphore:
+    """현재 이벤트 루프의 LLM 동시 호출 세마포어 (스트리밍 호출 등에서 직접 사용)"""
+    loop = asyncio.get_running_loop()
+    semaphore = _LLM_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _LLM_SEMAPHORES[loop] = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+    return semaphore
+
+
+async def ainvoke_llm(chain, inputs: dict):
+    """LLM 체인 비동기 호출 (동시 호출 수는 LLM_MAX_CONCURRENCY, 요청 속도는 LLM_RPM으로 제한)"""
+    async with llm_semaphore():
+        await LLM_RATE_LIMITER.aacquire()
+        return await chain.ainvoke(inputs)
+
+async def astream_llm(chain, inputs: dict):
+    """LLM 체인 스트리밍 호출 (ainvoke_llm과 같은 동시 호출/요청 속도 제한, 청크를 받는 대로 전달)"""
+    async with llm_semaphore():
+        await LLM_RATE_LIMITER.aacquire()
+        async for chunk in chain.astream(inputs):
+            yield chunk
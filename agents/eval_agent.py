@@ -0,0 +1,104 @@
+"""
+agents/eval_agent.py
+평가 영역별 분석 Agent 팩토리
+기술력/학습효과/시장성/경쟁력/성장가능성 Agent는 평가 기준과 참고 자료만 다르므로
+프롬프트 하나와 공통 본문을 공유하고, 영역별 설정만 넘겨 Agent를 생성
+"""
+from typing import Awaitable, Callable, Optional
+from langchain_core.prompts import ChatPromptTemplate
+from .base import AgentState, _BASE_PROMPT_PREFIX, EVALUATION_CHECKLIST_STR, CategoryScore, NO_SEARCH_RESULTS, llm, aget_web_context, ainvoke_llm
+
+
+# 모든 분석 Agent가 공유하는 프롬프트/체인 (모듈 로드 시 한 번만 생성)
+_PROMPT = ChatPromptTemplate.from_template(_BASE_PROMPT_PREFIX + """
+**평가 영역: {category}**
+
+**평가 기준 (각 항목 0-10점):**
+{checklist}
+
+**평가 대상:** 교육 스타트업 '{startup_name}'
+
+**참고 자료:**
+{context}
+""")
+_CHAIN = _PROMPT | llm.with_structured_output(CategoryScore)
+
+# 참고 자료가 전혀 없으면 LLM이 근거 없이 점수를 매기게 되므로 호출하지 않고 보수적인 기본 점수 사용
+# (항목 기준 50점 미만이라 근거가 부족한 스타트업은 '보류' 쪽으로 판단됨)
+NO_CONTEXT_SCORE = 40
+
+
+def make_eval_agent(
+    criterion_key: str,
+    search_topic: Optional[str],
+    state_score_key: str,
+    state_evidence_key: str,
+    *,
+    category: str,
+    banner: str,
+    get_context: Optional[Callable[[str], Awaitable[str]]] = None,
+):
+    """
+    평가 영역 하나를 담당하는 분석 Agent 생성
+    get_context가 없으면 '{스타트업} {search_topic}' 웹 검색 결과를 참고 자료로 사용
+    """
+
+    async def eval_agent(state: AgentState) -> AgentState:
+        print(f"\n{banner} {category} 분석 시작...")
+        
+        startup_name = state["startup_name"]
+        if get_context is not None:
+            context = await get_context(startup_name)
+        else:
+            context = await aget_web_context(startup_name, search_topic)
+        
+        if context == NO_SEARCH_RESULTS:
+            print(f"⚠️ {banner} 참고 자료 없음 - LLM 호출 생략 (기본 점수 {NO_CONTEXT_SCORE})")
+            return {
+                state_score_key: NO_CONTEXT_SCORE,
+                state_evidence_key: f"{category} 관련 참고 자료를 찾지 못해 기본 점수를 부여했습니다."
+            }
+        
+        result = await ainvoke_llm(_CHAIN, {
+            "category": category,
+            "startup_name": startup_name,
+            "checklist": EVALUATION_CHECKLIST_STR[criterion_key],
+            "context": context
+        })
+        
+        analysis = result.evidence
+        score = result.score
+        
+        print(f"✅ {banner} 완료 - {category} 점수: {score}")
+        
+        # 자신의 필드만 반환
+        return {
+            state_score_key: score,
+            state_evidence_key: analysis
+        }
+
+    eval_agent.__name__ = f"{criterion_key}_agent"
+    eval_agent.__doc__ = f"{banner}: {category} 분석"
+    return eval_agent
+
+
+# ========================================
+# 웹 검색만 사용하는 분석 Agent
+# ========================================
+
+technology_agent = make_eval_agent(
+    "technology", "교육 기술 혁신", "technology_score", "technology_analysis_evidence",
+    category="기술력", banner="🔧 [Agent 1]",
+)
+
+learning_effectiveness_agent = make_eval_agent(
+    "learning_effectiveness", "학습 효과 성과",
+    "learning_effectiveness_score", "learning_effectiveness_analysis_evidence",
+    category="학습 효과성", banner="📚 [Agent 2]",
+)
+
+growth_potential_agent = make_eval_agent(
+    "growth_potential", "성장 가능성 투자 유치",
+    "growth_potential_score", "growth_potential_analysis_evidence",
+    category="성장 가능성", banner="🚀 [Agent 5]",
+)
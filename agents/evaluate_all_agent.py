@@ -0,0 +1,86 @@
+"""
+agents/evaluate_all_agent.py
+통합 평가 Agent (6개 영역을 한 번의 구조화 출력 LLM 호출로 평가)
+"""
+import asyncio
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.pydantic_v1 import BaseModel
+from .base import AgentState, EVALUATION_CHECKLIST_STR, CategoryScore, llm, aget_web_context, ainvoke_llm
+from .market_agent import aget_market_context
+from .competition_agent import aget_competition_context
+from .risk_agent import MAX_CONTEXT_CHARS
+
+
+class EvaluationReport(BaseModel):
+    """6개 영역 평가 결과"""
+    technology: CategoryScore
+    learning: CategoryScore
+    market: CategoryScore
+    competition: CategoryScore
+    growth: CategoryScore
+    risk: CategoryScore
+
+
+def _section(title: str, criterion: str, context: str) -> str:
+    checklist = EVALUATION_CHECKLIST_STR[criterion]
+    return f"## {title}\n\n**평가 기준 (각 항목 0-10점):**\n{checklist}\n\n**참고 자료:**\n{context}"
+
+
+_PROMPT = ChatPromptTemplate.from_template("""
+교육 스타트업 '{startup_name}'을 아래 6개 영역별로 평가하세요.
+각 영역의 score는 항목 점수의 합계(0-100), evidence는 항목별 점수와 근거(URL 포함)입니다.
+
+{sections}
+""")
+_CHAIN = _PROMPT | llm.with_structured_output(EvaluationReport)
+
+
+async def evaluate_all_agent(state: AgentState) -> AgentState:
+    """통합 평가: 6개 분석 Agent 대신 한 번의 LLM 호출로 모든 영역 평가"""
+    print("\n🧮 [Batch] 통합 평가 시작...")
+    
+    startup_name = state["startup_name"]
+    
+    # 영역별 참고 자료는 서로 독립적이므로 동시에 수집
+    tech_ctx, learning_ctx, market_ctx, competition_ctx, growth_ctx, risk_ctx = await asyncio.gather(
+        aget_web_context(startup_name, "교육 기술 혁신"),
+        aget_web_context(startup_name, "학습 효과 성과"),
+        aget_market_context(startup_name),
+        aget_competition_context(startup_name),
+        aget_web_context(startup_name, "성장 가능성 투자 유치"),
+        aget_web_context(startup_name, "리스크 이슈 문제"),
+    )
+    
+    sections = "\n\n".join([
+        _section("technology (기술력)", "technology", tech_ctx),
+        _section("learning (학습 효과성)", "learning_effectiveness", learning_ctx),
+        _section("market (시장성)", "market", market_ctx),
+        _section("competition (경쟁력)", "competition", competition_ctx),
+        _section("growth (성장 가능성)", "growth_potential", growth_ctx),
+        _section("risk (리스크, 점수가 높을수록 리스크가 낮음)", "risk", risk_ctx[:MAX_CONTEXT_CHARS]),
+    ])
+    
+    report = await ainvoke_llm(_CHAIN, {
+        "startup_name": startup_name,
+        "sections": sections
+    })
+    
+    print(f"✅ [Batch] 완료 - 기술력 {report.technology.score}, 학습효과 {report.learning.score}, "
+          f"시장성 {report.market.score}, 경쟁력 {report.competition.score}, "
+          f"성장가능성 {report.growth.score}, 리스크 {report.risk.score}")
+    
+    # 기존 6개 Agent와 동일한 State 키로 반환 (judge/report는 변경 없음)
+    return {
+        "technology_score": report.technology.score,
+        "technology_analysis_evidence": report.technology.evidence,
+        "learning_effectiveness_score": report.learning.score,
+        "learning_effectiveness_analysis_evidence": report.learning.evidence,
+        "market_score": report.market.score,
+        "market_analysis_evidence": report.market.evidence,
+        "competition_score": report.competition.score,
+        "competition_analysis_evidence": report.competition.evidence,
+        "growth_potential_score": report.growth.score,
+        "growth_potential_analysis_evidence": report.growth.evidence,
+        # risk_agent와 같은 0~10 스케일
+        "risk_score": round(report.risk.score / 10),
+    }
@@ -2,11 +2,43 @@
 agents/judge_agent.py
 종합 판단 Agent
 """
+import os
 from langchain_core.prompts import ChatPromptTemplate
-from .base import AgentState, llm
+from .base import AgentState, llm, ainvoke_llm, risk_score_100
 
+# 판단 방식: 기본은 규칙 기반, JUDGE_MODE=llm 이면 기존처럼 LLM에게 결정을 맡김
+JUDGE_MODE = os.getenv("JUDGE_MODE", "rule")
 
-def comprehensive_judge_agent(state: AgentState) -> AgentState:
+# 투자 기준: 총점 70 이상 AND 모든 항목 50 이상
+INVEST_TOTAL_THRESHOLD = 70
+INVEST_ITEM_THRESHOLD = 50
+
+
+_PROMPT = ChatPromptTemplate.from_template("""
+다음 점수를 바탕으로 투자 결정을 내리세요:
+
+**점수 현황:**
+- 기술력: {tech}/100 (가중치 20%)
+- 학습효과: {learning}/100 (가중치 20%)
+- 시장성: {market}/100 (가중치 25%)
+- 경쟁력: {competition}/100 (가중치 15%)
+- 성장가능성: {growth}/100 (가중치 10%)
+- 리스크: {risk}/100 (가중치 10%, 높을수록 안전)
+
+**가중 평균 총점: {total}/100**
+
+**판단 기준:**
+- 총점 70 이상 AND 모든 항목 50 이상 → "투자"
+- 총점 50-69 OR 일부 항목 50 미만 → "보류"
+- 총점 50 미만 → "보류"
+
+**출력 형식:**
+결정만 출력: 투자 또는 보류
+""")
+_CHAIN = _PROMPT | llm
+
+
+async def comprehensive_judge_agent(state: AgentState) -> AgentState:
     """Agent 7: 종합 판단 - State의 모든 점수를 기반으로 투자 결정"""
     print("\n⚖️ [Agent 7] 종합 판단 시작...")
     
@@ -16,7 +48,7 @@ def comprehensive_judge_agent(state: AgentState) -> AgentState:
     market = state["market_score"]
     competition = state["competition_score"]
     growth = state["growth_potential_score"]
-    risk = state["risk_score"]
+    risk = risk_score_100(state)
     
     # 가중 평균 계산
     weights = {
@@ -37,41 +69,28 @@ def comprehensive_judge_agent(state: AgentState) -> AgentState:
         risk * weights["risk"]
     )
     
-    prompt = ChatPromptTemplate.from_template("""
-다음 점수를 바탕으로 투자 결정을 내리세요:
-
-**점수 현황:**
-- 기술력: {tech}/100 (가중치 20%)
-- 학습효과: {learning}/100 (가중치 20%)
-- 시장성: {market}/100 (가중치 25%)
-- 경쟁력: {competition}/100 (가중치 15%)
-- 성장가능성: {growth}/100 (가중치 10%)
-- 리스크: {risk}/100 (가중치 10%, 높을수록 안전)
-
-**가중 평균 총점: {total}/100**
-
-**판단 기준:**
-- 총점 70 이상 AND 모든 항목 50 이상 → "투자"
-- 총점 50-69 OR 일부 항목 50 미만 → "보류"
-- 총점 50 미만 → "보류"
-
-**출력 형식:**
-결정만 출력: 투자 또는 보류
-""")
-    
-    response = (prompt | llm).invoke({
-        "tech": tech,
-        "learning": learning,
-        "market": market,
-        "competition": competition,
-        "growth": growth,
-        "risk": risk,
-        "total": total_score
-    })
-    
-    # 투자 결정 추출
-    decision_text = response.content.strip()
-    decision = "투자" if "투자" in decision_text and "보류" not in decision_text else "보류"
+    if JUDGE_MODE == "llm":
+        response = await ainvoke_llm(_CHAIN, {
+            "tech": tech,
+            "learning": learning,
+            "market": market,
+            "competition": competition,
+            "growth": growth,
+            "risk": risk,
+            "total": total_score
+        })
+        
+        # 투자 결정 추출 - 응답의 첫 단어만 확인
+        # ("보류 (단 장기적 투자 고려)" 같은 응답이 투자로 분류되지 않도록)
+        words = response.content.split()
+        decision = "투자" if words and words[0].startswith("투자") else "보류"
+    else:
+        # 판단 기준이 결정적 규칙이므로 LLM 호출 없이 바로 결정
+        scores = [tech, learning, market, competition, growth, risk]
+        if total_score >= INVEST_TOTAL_THRESHOLD and min(scores) >= INVEST_ITEM_THRESHOLD:
+            decision = "투자"
+        else:
+            decision = "보류"
     
     print(f"✅ [Agent 7] 완료 - 최종 결정: {decision} (총점: {total_score})")
     
@@ -3,85 +3,153 @@ agents/market_agent.py
 시장성 분석 Agent (RAG 포함)
 """
 import os
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_community.document_loaders import PyMuPDFLoader
+import asyncio
+import shutil
+import hashlib
+import threading
+from functools import lru_cache
+from typing import Iterator, Tuple
+import fitz  # PyMuPDF
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_openai import OpenAIEmbeddings
 from langchain_chroma import Chroma
-try:
-    from langchain_tavily import TavilySearch
-except ImportError:
-    from langchain_community.tools.tavily_search import TavilySearchResults as TavilySearch
-from .base import AgentState, EVALUATION_CRITERIA, llm, extract_score
+from .base import tavily_search, EMBED_MODEL, EMBED_DIMENSIONS, EMBED_BATCH_SIZE, SHARED_EMBEDDINGS
+from .eval_agent import make_eval_agent
 
+# OpenAI 임베딩은 길이 1로 정규화되어 반환되므로 내적(ip) == 코사인 유사도
+# L2보다 거리 계산이 단순하고 검색 순위는 동일
+DISTANCE_SPACE = "ip"
 
-def market_agent(state: AgentState) -> AgentState:
-    """Agent 3: 시장성 분석 (RAG 포함)"""
-    print("\n💰 [Agent 3] 시장성 분석 시작...")
+# PDF별 Chroma 인덱스 저장 위치 (PDF 내용 해시로 하위 디렉토리 구분)
+CHROMA_CACHE_DIR = os.getenv("CHROMA_CACHE_DIR", ".chroma_cache")
+
+# 인덱스 생성이 끝까지 완료됐음을 표시하는 파일 (모든 청크 저장 후 마지막에 기록)
+INDEX_COMPLETE_MARKER = ".complete"
+
+# 인덱스 로드/생성 직렬화 - 여러 스타트업을 동시에 분석하면 to_thread 작업들이 같은 PDF를 동시에
+# 처음 로드할 수 있고, lru_cache는 동시 첫 호출을 막지 못해 중복 임베딩/디렉토리 삭제 경합이 생김
+_VECTORSTORE_LOCK = threading.Lock()
+
+
+def _iter_pdf_chunks(pdf_path: str) -> Iterator[Tuple[str, dict]]:
+    """
+    PDF를 페이지 단위로 읽으며 청크를 하나씩 반환
+    전체 페이지를 Document로 한꺼번에 올리지 않아 큰 PDF에서도 메모리 사용량이 일정
+    """
+    splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
+    with fitz.open(pdf_path) as pdf:
+        for page in pdf:
+            metadata = {"source": pdf_path, "page": page.number}
+            for chunk in splitter.split_text(page.get_text("text")):
+                yield chunk, metadata
+
+
+def load_pdf_vectorstore(pdf_path: str) -> Chroma:
+    """
+    PDF 벡터스토어 로드 (프로세스 내에서는 한 번 연 인덱스를 메모리에서 재사용)
+    파일 수정 시각/크기가 바뀌면 다시 로드
+    """
+    stat = os.stat(pdf_path)
+    with _VECTORSTORE_LOCK:
+        return _load_pdf_vectorstore(os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size)
+
+
+def load_pdf_retriever(pdf_path: str):
+    """PDF 검색기 (top-3) - 벡터스토어와 같은 기준으로 프로세스 내 재사용"""
+    stat = os.stat(pdf_path)
+    with _VECTORSTORE_LOCK:
+        return _load_pdf_retriever(os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_pdf_retriever(pdf_path: str, mtime_ns: int, size: int):
+    return _load_pdf_vectorstore(pdf_path, mtime_ns, size).as_retriever(search_kwargs={"k": 3})
+
+
+@lru_cache(maxsize=8)
+def _load_pdf_vectorstore(pdf_path: str, mtime_ns: int, size: int) -> Chroma:
+    """
+    PDF 벡터스토어 로드 (없으면 생성 후 디스크에 저장)
+    PDF 내용이 바뀌면 해시가 달라져 자동으로 새로 임베딩
+    """
+    with open(pdf_path, "rb") as f:
+        pdf_hash = hashlib.sha256(f.read()).hexdigest()[:12]
+    # 임베딩 모델/차원이 바뀌면 기존 인덱스와 호환되지 않으므로 디렉토리도 분리
+    persist_dir = os.path.join(
+        CHROMA_CACHE_DIR, f"{pdf_hash}_{EMBED_MODEL}_{EMBED_DIMENSIONS}_{DISTANCE_SPACE}"
+    )
+    collection_metadata = {"hnsw:space": DISTANCE_SPACE}
+    
+    # 디스크 캐시가 붙은 공유 임베딩 (같은 검색어는 재실행 시 API 호출 없이 재사용)
+    embeddings = SHARED_EMBEDDINGS
     
-    startup_name = state["startup_name"]
-    checklist = EVALUATION_CRITERIA["market"]
+    marker_path = os.path.join(persist_dir, INDEX_COMPLETE_MARKER)
+    if os.path.exists(marker_path):
+        return Chroma(
+            persist_directory=persist_dir,
+            embedding_function=embeddings,
+            collection_metadata=collection_metadata,
+        )
     
-    # PDF RAG
+    # 완료 표시 없이 남은 디렉토리는 이전 생성이 중단(Ctrl+C, 프로세스 종료 등)된 흔적이므로 지우고 새로 생성
+    shutil.rmtree(persist_dir, ignore_errors=True)
+    vectorstore = Chroma(
+        persist_directory=persist_dir,
+        embedding_function=embeddings,
+        collection_metadata=collection_metadata,
+    )
+    texts, metadatas = [], []
+    try:
+        for text, metadata in _iter_pdf_chunks(pdf_path):
+            texts.append(text)
+            metadatas.append(metadata)
+            if len(texts) >= EMBED_BATCH_SIZE:
+                vectorstore.add_texts(texts, metadatas=metadatas)
+                texts, metadatas = [], []
+        if texts:
+            vectorstore.add_texts(texts, metadatas=metadatas)
+    except Exception:
+        # 일부만 저장된 인덱스는 완료 표시가 없어 재사용되지 않지만, 디스크 공간을 위해 바로 삭제
+        shutil.rmtree(persist_dir, ignore_errors=True)
+        raise
+    
+    with open(marker_path, "w", encoding="utf-8"):
+        pass
+    return vectorstore
+
+
+def _retrieve_pdf_context(startup_name: str) -> str:
+    """PDF RAG - PDF_PATH의 시장 자료에서 관련 청크 검색"""
     pdf_path = os.getenv("PDF_PATH", "")
     rag_context = ""
     if pdf_path and os.path.exists(pdf_path):
         try:
-            loader = PyMuPDFLoader(pdf_path)
-            docs = loader.load_and_split(RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100))
-            vectorstore = Chroma.from_documents(docs, OpenAIEmbeddings())
-            retriever = vectorstore.as_retriever(search_kwargs={"k": 3})
-            retrieved = retriever.get_relevant_documents(f"{startup_name} 교육 시장")
+            retrieved = load_pdf_retriever(pdf_path).invoke(f"{startup_name} 교육 시장")
             rag_context = "\n".join([doc.page_content for doc in retrieved])
         except:
             rag_context = "PDF 로딩 실패"
-    
-    # Web Search
+    return rag_context
+
+
+def _search_market_context(startup_name: str) -> str:
+    """Web Search - 교육 시장 규모"""
     try:
-        search = TavilySearch(max_results=10)
-        results = search.invoke(f"{startup_name} 교육 시장 규모")
-        # TavilySearch는 문자열을 직접 반환하거나 리스트를 반환할 수 있음
-        if isinstance(results, str):
-            web_context = results
-        elif isinstance(results, list):
-            web_context = "\n".join([f"- {r.get('title', r.get('content', str(r)))}" for r in results])
-        else:
-            web_context = str(results)
+        return tavily_search(f"{startup_name} 교육 시장 규모", max_results=10)
     except Exception as e:
-        web_context = f"검색 실패: {str(e)}"
-    
-    combined = f"[PDF 자료]\n{rag_context}\n\n[웹 검색]\n{web_context}"
-    
-    prompt = ChatPromptTemplate.from_template("""
-교육 스타트업 '{startup_name}'의 시장성을 평가하세요.
+        return f"검색 실패: {str(e)}"
 
-**평가 기준 (각 항목 0-10점):**
-{checklist}
 
-**참고 자료:**
-{context}
+async def aget_market_context(startup_name: str) -> str:
+    """시장성 참고 자료 (PDF RAG + 웹 검색)"""
+    # PDF RAG와 웹 검색은 서로 독립적이므로 동시에 수행 (둘 다 블로킹 호출이라 스레드에서 실행)
+    rag_context, web_context = await asyncio.gather(
+        asyncio.to_thread(_retrieve_pdf_context, startup_name),
+        asyncio.to_thread(_search_market_context, startup_name),
+    )
+    return f"[PDF 자료]\n{rag_context}\n\n[웹 검색]\n{web_context}"
 
-**출력 형식:**
-각 항목별로:
-- 점수 (0-10점)
-- 근거 (URL 포함)
 
-마지막에 **총점: [0-100 숫자]** 형식으로 작성하세요.
-""")
-    
-    response = (prompt | llm).invoke({
-        "startup_name": startup_name,
-        "checklist": "\n".join(f"{i+1}. {q}" for i, q in enumerate(checklist)),
-        "context": combined
-    })
-    
-    analysis = response.content
-    score = extract_score(analysis)
-    
-    print(f"✅ [Agent 3] 완료 - 시장성 점수: {score}")
-    
-    # 자신의 필드만 반환
-    return {
-        "market_score": score,
-        "market_analysis_evidence": analysis
-    }
\ No newline at end of file
+# 시장성 Agent (참고 자료: PDF RAG + 웹 검색)
+market_agent = make_eval_agent(
+    "market", None, "market_score", "market_analysis_evidence",
+    category="시장성", banner="💰 [Agent 3]", get_context=aget_market_context,
+)
@@ -0,0 +1,48 @@
+"""
+agents/quick_score_agent.py
+빠른 스크리닝 Agent (총점만 필요한 경로용, 스트리밍 조기 종료)
+"""
+from langchain_core.prompts import ChatPromptTemplate
+from .base import AgentState, EVALUATION_CRITERIA, llm, aget_web_context, astream_score
+
+
+# 근거보다 총점을 먼저 출력하게 해야 조기 종료 효과가 있음
+_PROMPT = ChatPromptTemplate.from_template("""
+교육 스타트업 '{startup_name}'의 투자 매력도를 빠르게 평가하세요.
+
+**평가 영역:**
+{categories}
+
+**참고 자료:**
+{context}
+
+**출력 형식:**
+첫 줄에 **총점: [0-100 숫자]** 형식으로 먼저 작성하고,
+그 다음 줄부터 영역별 핵심 근거를 간단히 작성하세요.
+""")
+_CHAIN = _PROMPT | llm
+
+
+async def quick_score_agent(state: AgentState) -> AgentState:
+    """스크리닝: 총점이 출력되는 즉시 LLM 생성을 중단하고 점수만 반환"""
+    print("\n⏱️ [Quick] 빠른 스크리닝 시작...")
+    
+    startup_name = state["startup_name"]
+    try:
+        context = await aget_web_context(startup_name, "교육 스타트업 투자")
+        score, _ = await astream_score(_CHAIN, {
+            "startup_name": startup_name,
+            "categories": "\n".join(f"- {name}" for name in EVALUATION_CRITERIA),
+            "context": context
+        })
+    except Exception as e:
+        # 스크리닝 실패로 후보가 탈락하지 않도록 점수 없이 전체 분석으로 진행
+        print(f"⚠️ [Quick] 스크리닝 실패: {e} - 전체 분석 진행")
+        return {"startup_name": startup_name}
+    
+    print(f"✅ [Quick] 완료 - 스크리닝 점수: {score}")
+    
+    # 자신의 필드만 반환
+    return {
+        "quick_score": score
+    }
@@ -3,14 +3,25 @@ agents/report_agent.py
 보고서 생성 Agent (PDF 출력 - 선택사항)
 """
 import os
+import re
+import sys
+import queue
+import asyncio
 from datetime import datetime
+from string import Template
+from typing import Optional
 from langchain_core.prompts import ChatPromptTemplate
-from .base import AgentState, llm
+from .base import AgentState, llm, astream_llm, risk_score_100
+
+# Markdown → HTML 변환 라이브러리 (선택적 import - 없으면 Markdown 보고서만 저장)
+try:
+    import markdown
+except ImportError:
+    markdown = None
 
 # PDF 생성 라이브러리 (선택적 import)
 PDF_AVAILABLE = False
 try:
-    import markdown
     from weasyprint import HTML, CSS
     PDF_AVAILABLE = True
 except (ImportError, OSError) as e:
@@ -18,204 +29,21 @@ except (ImportError, OSError) as e:
     pass
 
 
-def markdown_to_pdf_weasyprint(markdown_text: str, output_path: str, startup_name: str) -> bool:
-    """
-    WeasyPrint를 사용한 PDF 변환
-    """
-    if not PDF_AVAILABLE:
-        return False
-    
-    try:
-        # 1. Markdown을 HTML로 변환
-        html_content = markdown.markdown(
-            markdown_text,
-            extensions=['tables', 'fenced_code', 'codehilite']
-        )
-        
-        # 2. HTML 템플릿 생성 (한글 폰트 지원)
-        html_template = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{startup_name} 투자 심사 보고서</title>
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;500;700&display=swap');
-        
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Noto Sans KR', 'Malgun Gothic', '맑은 고딕', sans-serif;
-            line-height: 1.8;
-            color: #333;
-            padding: 40px;
-            max-width: 1200px;
-            margin: 0 auto;
-            background-color: #ffffff;
-        }}
-        
-        h1 {{
-            color: #2c3e50;
-            font-size: 32px;
-            font-weight: 700;
-            margin-bottom: 10px;
-            padding-bottom: 15px;
-            border-bottom: 4px solid #3498db;
-        }}
-        
-        h2 {{
-            color: #34495e;
-            font-size: 24px;
-            font-weight: 600;
-            margin-top: 40px;
-            margin-bottom: 20px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #ecf0f1;
-        }}
-        
-        h3 {{
-            color: #7f8c8d;
-            font-size: 18px;
-            font-weight: 500;
-            margin-top: 30px;
-            margin-bottom: 15px;
-        }}
-        
-        p {{
-            margin-bottom: 15px;
-            text-align: justify;
-        }}
-        
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-            background-color: #fff;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        
-        th {{
-            background-color: #3498db;
-            color: white;
-            padding: 12px;
-            text-align: left;
-            font-weight: 600;
-        }}
-        
-        td {{
-            padding: 12px;
-            border-bottom: 1px solid #ecf0f1;
-        }}
-        
-        tr:hover {{
-            background-color: #f8f9fa;
-        }}
-        
-        strong {{
-            color: #2980b9;
-            font-weight: 600;
-        }}
-        
-        ul, ol {{
-            margin-left: 30px;
-            margin-bottom: 15px;
-        }}
-        
-        li {{
-            margin-bottom: 8px;
-        }}
-        
-        .header {{
-            text-align: center;
-            margin-bottom: 40px;
-            padding: 30px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border-radius: 10px;
-        }}
-        
-        .header h1 {{
-            color: white;
-            border-bottom: none;
-            margin-bottom: 10px;
-        }}
-        
-        .header p {{
-            font-size: 14px;
-            opacity: 0.9;
-        }}
-        
-        .footer {{
-            margin-top: 60px;
-            padding-top: 20px;
-            border-top: 2px solid #ecf0f1;
-            text-align: center;
-            font-size: 12px;
-            color: #95a5a6;
-        }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>📊 투자 심사 보고서</h1>
-        <p>{startup_name} | {datetime.now().strftime('%Y년 %m월 %d일')}</p>
-    </div>
-    
-    {html_content}
-    
-    <div class="footer">
-        <p>본 보고서는 AI 기반 자동 분석 시스템에 의해 생성되었습니다.</p>
-        <p>© {datetime.now().year} Investment Analysis System. All rights reserved.</p>
-    </div>
-</body>
-</html>
-"""
-        
-        # 3. HTML을 PDF로 변환
-        HTML(string=html_template).write_pdf(output_path)
-        
-        return True
-        
-    except Exception as e:
-        print(f"   ⚠️ WeasyPrint PDF 생성 실패: {e}")
-        return False
+# 보고서 저장 위치 (보고서마다 mkdir하지 않도록 시작 시 한 번만 생성)
+REPORT_OUTPUT_DIR = "investment_reports"
+os.makedirs(REPORT_OUTPUT_DIR, exist_ok=True)
 
 
-def save_html_report(markdown_text: str, output_path: str, startup_name: str) -> bool:
-    """
-    HTML 보고서 저장 (PDF 대체 방법)
-    브라우저에서 열어서 PDF로 출력 가능
-    """
-    try:
-        import markdown
-        
-        html_content = markdown.markdown(
-            markdown_text,
-            extensions=['tables', 'fenced_code', 'codehilite']
-        )
-        
-        html_template = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{startup_name} 투자 심사 보고서</title>
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;500;700&display=swap');
+# 보고서 HTML 공통 CSS (PDF/HTML 보고서 공용, 모듈 로드 시 한 번만 생성)
+_BASE_CSS = """        @import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;500;700&display=swap');
         
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Noto Sans KR', 'Malgun Gothic', '맑은 고딕', sans-serif;
             line-height: 1.8;
             color: #333;
@@ -223,18 +51,18 @@ def save_html_report(markdown_text: str, output_path: str, startup_name: str) ->
             max-width: 1200px;
             margin: 0 auto;
             background-color: #ffffff;
-        }}
+        }
         
-        h1 {{
+        h1 {
             color: #2c3e50;
             font-size: 32px;
             font-weight: 700;
             margin-bottom: 10px;
             padding-bottom: 15px;
             border-bottom: 4px solid #3498db;
-        }}
+        }
         
-        h2 {{
+        h2 {
             color: #34495e;
             font-size: 24px;
             font-weight: 600;
@@ -242,90 +70,93 @@ def save_html_report(markdown_text: str, output_path: str, startup_name: str) ->
             margin-bottom: 20px;
             padding-bottom: 10px;
             border-bottom: 2px solid #ecf0f1;
-        }}
+        }
         
-        h3 {{
+        h3 {
             color: #7f8c8d;
             font-size: 18px;
             font-weight: 500;
             margin-top: 30px;
             margin-bottom: 15px;
-        }}
+        }
         
-        p {{
+        p {
             margin-bottom: 15px;
             text-align: justify;
-        }}
+        }
         
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 20px 0;
             background-color: #fff;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
+        }
         
-        th {{
+        th {
             background-color: #3498db;
             color: white;
             padding: 12px;
             text-align: left;
             font-weight: 600;
-        }}
+        }
         
-        td {{
+        td {
             padding: 12px;
             border-bottom: 1px solid #ecf0f1;
-        }}
+        }
         
-        tr:hover {{
+        tr:hover {
             background-color: #f8f9fa;
-        }}
+        }
         
-        strong {{
+        strong {
             color: #2980b9;
             font-weight: 600;
-        }}
+        }
         
-        ul, ol {{
+        ul, ol {
             margin-left: 30px;
             margin-bottom: 15px;
-        }}
+        }
         
-        li {{
+        li {
             margin-bottom: 8px;
-        }}
+        }
         
-        .header {{
+        .header {
             text-align: center;
             margin-bottom: 40px;
             padding: 30px;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             border-radius: 10px;
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             color: white;
             border-bottom: none;
             margin-bottom: 10px;
-        }}
+        }
         
-        .header p {{
+        .header p {
             font-size: 14px;
             opacity: 0.9;
-        }}
+        }
         
-        .footer {{
+        .footer {
             margin-top: 60px;
             padding-top: 20px;
             border-top: 2px solid #ecf0f1;
             text-align: center;
             font-size: 12px;
             color: #95a5a6;
-        }}
-        
-        .print-button {{
+        }
+"""
+
+# HTML 보고서 전용 CSS (인쇄 버튼)
+_HTML_EXTRA_CSS = """        
+        .print-button {
             position: fixed;
             top: 20px;
             right: 20px;
@@ -337,46 +168,133 @@ def save_html_report(markdown_text: str, output_path: str, startup_name: str) ->
             cursor: pointer;
             font-size: 16px;
             box-shadow: 0 2px 8px rgba(0,0,0,0.2);
-        }}
+        }
         
-        .print-button:hover {{
+        .print-button:hover {
             background: #2980b9;
-        }}
+        }
         
-        @media print {{
-            .print-button {{
+        @media print {
+            .print-button {
                 display: none;
-            }}
+            }
             
-            body {{
+            body {
                 padding: 20px;
-            }}
-        }}
-    </style>
+            }
+        }
+"""
+
+# 보고서 HTML 템플릿 (CSS 중괄호와 충돌하지 않도록 string.Template의 $ 치환 사용)
+_REPORT_TEMPLATE = Template("""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$startup_name 투자 심사 보고서</title>
+    <style>
+$css    </style>
 </head>
 <body>
-    <button class="print-button" onclick="window.print()">🖨️ PDF로 저장</button>
-    
-    <div class="header">
+$print_button    <div class="header">
         <h1>📊 투자 심사 보고서</h1>
-        <p>{startup_name} | {datetime.now().strftime('%Y년 %m월 %d일')}</p>
+        <p>$startup_name | $date</p>
     </div>
     
-    {html_content}
+    $html_content
     
     <div class="footer">
         <p>본 보고서는 AI 기반 자동 분석 시스템에 의해 생성되었습니다.</p>
-        <p>© {datetime.now().year} Investment Analysis System. All rights reserved.</p>
-        <p style="margin-top: 10px; font-size: 11px;">
-            💡 브라우저에서 Ctrl+P (또는 우측 상단 버튼)를 눌러 PDF로 저장할 수 있습니다.
-        </p>
-    </div>
+        <p>© $year Investment Analysis System. All rights reserved.</p>
+$footer_note    </div>
 </body>
 </html>
+""")
+
+_PRINT_BUTTON = """    <button class="print-button" onclick="window.print()">🖨️ PDF로 저장</button>
+    
+"""
+
+_PRINT_NOTE = """        <p style="margin-top: 10px; font-size: 11px;">
+            💡 브라우저에서 Ctrl+P (또는 우측 상단 버튼)를 눌러 PDF로 저장할 수 있습니다.
+        </p>
 """
+
+
+def markdown_to_html(markdown_text: str) -> Optional[str]:
+    """
+    Markdown 보고서 본문을 HTML 조각으로 변환 (보고서당 한 번만 변환해 HTML/PDF 저장에 공용)
+    markdown 패키지가 없거나 변환에 실패하면 None
+    """
+    if markdown is None:
+        print("   ⚠️ markdown 패키지 미설치 - HTML 변환 생략")
+        return None
+    
+    try:
+        return markdown.markdown(
+            markdown_text,
+            extensions=['tables', 'fenced_code', 'codehilite']
+        )
+    except Exception as e:
+        print(f"   ⚠️ HTML 변환 실패: {e}")
+        return None
+
+
+def _render_report_html(html_content: str, startup_name: str, for_print: bool) -> str:
+    """변환된 본문을 보고서 HTML 문서로 감쌈 (for_print=True면 인쇄 버튼/안내 포함)"""
+    now = datetime.now()
+    return _REPORT_TEMPLATE.substitute(
+        startup_name=startup_name,
+        date=now.strftime('%Y년 %m월 %d일'),
+        year=now.year,
+        html_content=html_content,
+        css=_BASE_CSS + (_HTML_EXTRA_CSS if for_print else ""),
+        print_button=_PRINT_BUTTON if for_print else "",
+        footer_note=_PRINT_NOTE if for_print else "",
+    )
+
+
+def html_to_pdf_weasyprint(html_content: str, output_path: str, startup_name: str) -> bool:
+    """
+    WeasyPrint를 사용한 PDF 변환
+    """
+    if not PDF_AVAILABLE:
+        return False
+    
+    try:
+        # HTML 본문 → 한글 폰트 지원 템플릿 → PDF
+        html = _render_report_html(html_content, startup_name, for_print=False)
+        HTML(string=html).write_pdf(output_path)
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ⚠️ WeasyPrint PDF 생성 실패: {e}")
+        return False
+
+
+def write_markdown_stream(chunks: "queue.Queue[Optional[str]]", output_path: str) -> None:
+    """
+    큐로 전달되는 Markdown 청크를 도착 순서대로 파일에 기록 (None을 받으면 종료)
+    블로킹 파일 I/O라 이벤트 루프 밖 스레드에서 호출
+    """
+    with open(output_path, 'w', encoding='utf-8') as f:
+        while (chunk := chunks.get()) is not None:
+            f.write(chunk)
+            f.flush()
+
+
+def save_html_report(html_content: str, output_path: str, startup_name: str) -> bool:
+    """
+    HTML 보고서 저장 (PDF 대체 방법)
+    브라우저에서 열어서 PDF로 출력 가능
+    """
+    try:
+        html = _render_report_html(html_content, startup_name, for_print=True)
         
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_template)
+            f.write(html)
         
         return True
         
@@ -385,11 +303,7 @@ def save_html_report(markdown_text: str, output_path: str, startup_name: str) ->
         return False
 
 
-def report_generation_agent(state: AgentState) -> AgentState:
-    """Agent 8: 최종 보고서 생성 - Markdown + HTML (PDF 선택)"""
-    print("\n📝 [Agent 8] 보고서 생성 시작...")
-    
-    prompt = ChatPromptTemplate.from_template("""
+_PROMPT = ChatPromptTemplate.from_template("""
 # 투자 심사 보고서
 
 ## 기본 정보
@@ -427,8 +341,46 @@ def report_generation_agent(state: AgentState) -> AgentState:
 ## 최종 종합 결론
 위 분석 결과를 바탕으로 SWOT 분석과 투자 권고사항을 작성하세요.
 """)
+_CHAIN = _PROMPT | llm
+
+
+# 보고서 프롬프트에 넣을 항목별 근거 최대 길이 (입력 토큰/첫 토큰 지연 감소)
+REPORT_EVIDENCE_MAX_CHARS = 1500
+
+# 근거에서 우선 보존할 줄: 점수가 적힌 줄, 출처 URL이 있는 줄
+_KEY_LINE_PATTERN = re.compile(r"점수|\d+\s*점|https?://")
+
+
+def _compress_evidence(text: str, max_chars: int = REPORT_EVIDENCE_MAX_CHARS) -> str:
+    """
+    근거 텍스트를 max_chars 이내로 압축
+    점수/URL이 포함된 줄만 남기고, 그래도 길면 잘라냄
+    """
+    if len(text) <= max_chars:
+        return text
     
-    response = (prompt | llm).invoke({
+    key_lines = [line for line in text.splitlines() if _KEY_LINE_PATTERN.search(line)]
+    compressed = "\n".join(key_lines) if key_lines else text
+    if len(compressed) > max_chars:
+        compressed = compressed[:max_chars].rstrip() + " ..."
+    return compressed
+
+
+async def _skip() -> bool:
+    return False
+
+
+async def report_generation_agent(state: AgentState) -> AgentState:
+    """Agent 8: 최종 보고서 생성 - Markdown + HTML (PDF 선택)"""
+    print("\n📝 [Agent 8] 보고서 생성 시작...")
+    
+    # 파일 저장 (출력 디렉토리는 모듈 로드 시 생성됨)
+    base_filename = f"{state['startup_name']}_투자분석_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    md_filepath = os.path.join(REPORT_OUTPUT_DIR, f"{base_filename}.md")
+    html_filepath = os.path.join(REPORT_OUTPUT_DIR, f"{base_filename}.html")
+    pdf_filepath = os.path.join(REPORT_OUTPUT_DIR, f"{base_filename}.pdf")
+    
+    inputs = {
         "startup_name": state["startup_name"],
         "date": datetime.now().strftime("%Y년 %m월 %d일"),
         "decision": state["final_judge"],
@@ -437,41 +389,54 @@ def report_generation_agent(state: AgentState) -> AgentState:
         "market": state["market_score"],
         "competition": state["competition_score"],
         "growth": state["growth_potential_score"],
-        "risk": state["risk_score"],
-        "tech_evidence": state["technology_analysis_evidence"],
-        "learning_evidence": state["learning_effectiveness_analysis_evidence"],
-        "market_evidence": state["market_analysis_evidence"],
-        "competition_evidence": state["competition_analysis_evidence"],
-        "growth_evidence": state["growth_potential_analysis_evidence"]
-    })
+        "risk": risk_score_100(state),
+        "tech_evidence": _compress_evidence(state["technology_analysis_evidence"]),
+        "learning_evidence": _compress_evidence(state["learning_effectiveness_analysis_evidence"]),
+        "market_evidence": _compress_evidence(state["market_analysis_evidence"]),
+        "competition_evidence": _compress_evidence(state["competition_analysis_evidence"]),
+        "growth_evidence": _compress_evidence(state["growth_potential_analysis_evidence"])
+    }
     
-    markdown_content = response.content
+    # 1. Markdown 파일 저장 (항상) - 응답을 스트리밍으로 받으면서 바로 기록
+    #    파일 쓰기는 스레드 하나가 큐에서 청크를 꺼내 처리 (이벤트 루프에서 디스크 I/O를 하지 않도록)
+    parts = []
+    chunk_queue: "queue.Queue[Optional[str]]" = queue.Queue()
+    writer = asyncio.ensure_future(asyncio.to_thread(write_markdown_stream, chunk_queue, md_filepath))
+    try:
+        async for chunk in astream_llm(_CHAIN, inputs):
+            chunk_queue.put_nowait(chunk.content)
+            parts.append(chunk.content)
+            print(f"\r   ✍️ 보고서 작성 중... ({len(parts)} chunks)", end="", file=sys.stderr, flush=True)
+    finally:
+        chunk_queue.put_nowait(None)
+        await writer
+    print(file=sys.stderr)
+    markdown_content = "".join(parts)
+    print(f"   ✅ Markdown 저장: {md_filepath}")
     
-    # 파일 저장
-    output_dir = "investment_reports"
-    os.makedirs(output_dir, exist_ok=True)
+    # Markdown → HTML 변환은 한 번만 하고 HTML/PDF 저장에서 같은 결과를 공유 (CPU 작업이라 스레드에서 실행)
+    html_content = await asyncio.to_thread(markdown_to_html, markdown_content)
     
-    base_filename = f"{state['startup_name']}_투자분석_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    # HTML / PDF 저장은 서로 독립적이고 블로킹 작업(특히 WeasyPrint)이므로
+    # 스레드에서 동시에 실행해 이벤트 루프를 막지 않음
+    html_saved, pdf_saved = await asyncio.gather(
+        # 2. HTML 파일 저장 (항상 - 브라우저에서 PDF 출력 가능)
+        asyncio.to_thread(save_html_report, html_content, html_filepath, state["startup_name"])
+        if html_content is not None else _skip(),
+        # 3. PDF 파일 생성 시도 (WeasyPrint 사용 가능한 경우만)
+        asyncio.to_thread(html_to_pdf_weasyprint, html_content, pdf_filepath, state["startup_name"])
+        if PDF_AVAILABLE and html_content is not None else _skip(),
+    )
     
-    # 1. Markdown 파일 저장 (항상)
-    md_filepath = os.path.join(output_dir, f"{base_filename}.md")
-    with open(md_filepath, 'w', encoding='utf-8') as f:
-        f.write(markdown_content)
-    print(f"   ✅ Markdown 저장: {md_filepath}")
+    final_path = md_filepath
     
-    # 2. HTML 파일 저장 (항상 - 브라우저에서 PDF 출력 가능)
-    html_filepath = os.path.join(output_dir, f"{base_filename}.html")
-    if save_html_report(markdown_content, html_filepath, state["startup_name"]):
+    if html_saved:
         print(f"   ✅ HTML 저장: {html_filepath}")
         print(f"      💡 브라우저로 열어서 Ctrl+P로 PDF 저장 가능")
         final_path = html_filepath
-    else:
-        final_path = md_filepath
     
-    # 3. PDF 파일 생성 시도 (WeasyPrint 사용 가능한 경우만)
     if PDF_AVAILABLE:
-        pdf_filepath = os.path.join(output_dir, f"{base_filename}.pdf")
-        if markdown_to_pdf_weasyprint(markdown_content, pdf_filepath, state["startup_name"]):
+        if pdf_saved:
             print(f"   ✅ PDF 저장: {pdf_filepath}")
             final_path = pdf_filepath
         else:
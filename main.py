@@ -2,120 +2,34 @@
 main.py
 투자 심사 시스템 메인 실행 파일 (병렬 처리 최적화)
 """
-from typing import Sequence
-from langgraph.graph import StateGraph, END, START
-from agents.base import AgentState
-from agents.technology_agent import technology_agent
-from agents.learning_effectiveness_agent import learning_effectiveness_agent
-from agents.market_agent import market_agent
-from agents.competition_agent import competition_agent
-from agents.growth_potential_agent import growth_potential_agent
-from agents.risk_agent import risk_agent
-from agents.judge_agent import comprehensive_judge_agent
-from agents.report_agent import report_generation_agent
+import os
+import asyncio
+import contextlib
+from typing import List
+from workflow import arun, arun_many
+from agents.base import risk_score_100
 import time
 
+# uvloop (선택적 import) - libuv 기반 이벤트 루프로 동시 HTTP 요청 처리량 향상 (Windows 미지원)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-def start_node(state: AgentState) -> dict:
-    """시작 노드 - 병렬 실행을 위한 진입점"""
-    print("\n🚀 분석 시작 - 6개 Agent 병렬 실행 준비")
-    print("-" * 70)
-    # 아무것도 업데이트하지 않음 (빈 딕셔너리 반환)
-    return {}
 
-
-def route_to_parallel_agents(state: AgentState) -> Sequence[str]:
-    """
-    병렬로 실행할 Agent 노드 목록 반환
-    이 함수가 반환하는 노드들이 모두 병렬로 실행됨
-    """
-    return ["technology", "learning", "market", "competition", "growth", "risk"]
-
-
-def build_agent_workflow():
-    """
-    병렬 Agent 기반 워크플로우 구축 (Fan-out & Fan-in)
-    
-    구조:
-    START → start → [6개 분석 Agent 병렬 실행] → Judge → Report → END
-    """
-    
-    workflow = StateGraph(AgentState)
-    
-    # 노드 추가
-    workflow.add_node("start", start_node)
-    workflow.add_node("technology", technology_agent)
-    workflow.add_node("learning", learning_effectiveness_agent)
-    workflow.add_node("market", market_agent)
-    workflow.add_node("competition", competition_agent)
-    workflow.add_node("growth", growth_potential_agent)
-    workflow.add_node("risk", risk_agent)
-    workflow.add_node("judge", comprehensive_judge_agent)
-    workflow.add_node("report", report_generation_agent)
-    
-    # ========================================
-    # Fan-out: start → 6개 Agent 병렬 분기
-    # ========================================
-    workflow.add_edge(START, "start")
-    
-    # 병렬로 실행할 agent 목록
-    parallel_agents = ["technology", "learning", "market", "competition", "growth", "risk"]
-    
-    # start 노드에서 6개 agent로 조건부 분기 (모두 병렬 실행)
-    workflow.add_conditional_edges(
-        "start",
-        route_to_parallel_agents,
-        parallel_agents,  # 가능한 경로 목록
-    )
-    
-    # ========================================
-    # Fan-in: 모든 병렬 Agent → Judge로 수렴
-    # ========================================
-    for agent in parallel_agents:
-        workflow.add_edge(agent, "judge")
-    
-    # ========================================
-    # 순차 실행: Judge → Report → END
-    # ========================================
-    workflow.add_edge("judge", "report")
-    workflow.add_edge("report", END)
-    
-    return workflow.compile()
-
-
-def run_investment_analysis(startup_name: str):
-    """투자 분석 실행 (병렬 처리)"""
+async def arun_investment_analysis(startup_name: str, batch: bool = False):
+    """투자 분석 실행 (병렬 처리, batch=True면 통합 평가 모드) - 이벤트 루프 안에서 호출"""
     
     print("=" * 70)
     print(f"🎯 투자 심사 시작: {startup_name}")
-    print("🚀 Fan-out & Fan-in 병렬 처리 모드")
+    print("🧮 통합 평가 모드" if batch else "🚀 Fan-out & Fan-in 병렬 처리 모드")
     print("=" * 70)
     
-    # 초기 State
-    initial_state: AgentState = {
-        "startup_name": startup_name,
-        "technology_score": 0,
-        "technology_analysis_evidence": "",
-        "learning_effectiveness_score": 0,
-        "learning_effectiveness_analysis_evidence": "",
-        "market_score": 0,
-        "market_analysis_evidence": "",
-        "competition_score": 0,
-        "competition_analysis_evidence": "",
-        "growth_potential_score": 0,
-        "growth_potential_analysis_evidence": "",
-        "risk_score": 0,
-        "final_judge": "보류",
-        "report": "",
-        "pdf_path": ""
-    }
-    
     # 시작 시간 측정
     start_time = time.time()
     
-    # Agent 워크플로우 실행
-    agent = build_agent_workflow()
-    final_state = agent.invoke(initial_state)
+    # Agent 워크플로우 실행 (분석 Agent가 async이므로 ainvoke 사용)
+    final_state = await arun(startup_name, batch=batch)
     
     # 종료 시간 측정
     end_time = time.time()
@@ -134,74 +48,66 @@ def run_investment_analysis(startup_name: str):
     print(f"  💰 시장성: {final_state['market_score']}")
     print(f"  ⚔️ 경쟁력: {final_state['competition_score']}")
     print(f"  🚀 성장가능성: {final_state['growth_potential_score']}")
-    print(f"  ⚠️ 리스크: {final_state['risk_score']}")
+    print(f"  ⚠️ 리스크: {risk_score_100(final_state)}")
     print(f"\n📄 보고서: {final_state['pdf_path']}")
     print("=" * 70)
     
     return final_state
 
 
-def compare_performance(startup_name: str):
-    """순차 vs 병렬 성능 비교 (테스트용)"""
+async def arun_investment_analyses(startup_names: List[str], batch: bool = False):
+    """여러 스타트업 동시 투자 분석 - 스타트업별 결과 요약 출력"""
+    
+    print("=" * 70)
+    print(f"🎯 투자 심사 시작: {', '.join(startup_names)} ({len(startup_names)}개 동시 분석)")
+    print("=" * 70)
+    
+    start_time = time.time()
+    final_states = await arun_many(startup_names, batch=batch)
+    execution_time = time.time() - start_time
+    
+    print("\n" + "=" * 70)
+    print("📊 최종 결과")
+    print("=" * 70)
+    for final_state in final_states:
+        if final_state.get("pdf_path"):
+            print(f"  {final_state['startup_name']}: {final_state['final_judge']} (📄 {final_state['pdf_path']})")
+        else:
+            print(f"  {final_state['startup_name']}: {final_state['final_judge']} (⏭️ 스크리닝 탈락 - 점수 {final_state['quick_score']})")
+    print(f"\n⏱️  총 실행 시간: {execution_time:.2f}초")
+    print("=" * 70)
+    
+    return final_states
+
+
+def run_investment_analysis(startup_name: str, batch: bool = False):
+    """투자 분석 실행 (동기 진입점)"""
+    return asyncio.run(arun_investment_analysis(startup_name, batch))
+
+
+async def acompare_performance(startup_name: str):
+    """순차 vs 병렬 성능 비교 (테스트용) - 이벤트 루프 안에서 호출"""
     print("\n" + "🔬 " * 20)
     print("성능 비교 테스트: 순차 실행 vs 병렬 실행")
     print("🔬 " * 20 + "\n")
     
-    # 순차 실행 워크플로우
-    def build_sequential_workflow():
-        workflow = StateGraph(AgentState)
-        workflow.add_node("technology", technology_agent)
-        workflow.add_node("learning", learning_effectiveness_agent)
-        workflow.add_node("market", market_agent)
-        workflow.add_node("competition", competition_agent)
-        workflow.add_node("growth", growth_potential_agent)
-        workflow.add_node("risk", risk_agent)
-        workflow.add_node("judge", comprehensive_judge_agent)
-        workflow.add_node("report", report_generation_agent)
-        
-        workflow.add_edge(START, "technology")
-        workflow.add_edge("technology", "learning")
-        workflow.add_edge("learning", "market")
-        workflow.add_edge("market", "competition")
-        workflow.add_edge("competition", "growth")
-        workflow.add_edge("growth", "risk")
-        workflow.add_edge("risk", "judge")
-        workflow.add_edge("judge", "report")
-        workflow.add_edge("report", END)
-        return workflow.compile()
-    
-    initial_state: AgentState = {
-        "startup_name": startup_name,
-        "technology_score": 0,
-        "technology_analysis_evidence": "",
-        "learning_effectiveness_score": 0,
-        "learning_effectiveness_analysis_evidence": "",
-        "market_score": 0,
-        "market_analysis_evidence": "",
-        "competition_score": 0,
-        "competition_analysis_evidence": "",
-        "growth_potential_score": 0,
-        "growth_potential_analysis_evidence": "",
-        "risk_score": 0,
-        "final_judge": "보류",
-        "report": "",
-        "pdf_path": ""
-    }
+    async def measure(parallel: bool) -> float:
+        # 측정 중에는 Agent 진행 로그를 버려 출력 비용이 실행 시간에 섞이지 않도록 함
+        with open(os.devnull, "w") as devnull, \
+                contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+            start = time.time()
+            await arun(startup_name, parallel=parallel)
+            return time.time() - start
     
+    # 공유 HTTP 연결이 하나의 이벤트 루프에 묶이도록 두 실행을 같은 루프에서 수행
     # 순차 실행
     print("🐌 순차 실행 모드 테스트 중...")
-    seq_agent = build_sequential_workflow()
-    seq_start = time.time()
-    seq_agent.invoke(initial_state)
-    seq_time = time.time() - seq_start
+    seq_time = await measure(parallel=False)
     print(f"   완료: {seq_time:.2f}초")
     
     # 병렬 실행
     print("\n🚀 병렬 실행 모드 테스트 중...")
-    par_agent = build_agent_workflow()
-    par_start = time.time()
-    par_agent.invoke(initial_state)
-    par_time = time.time() - par_start
+    par_time = await measure(parallel=True)
     print(f"   완료: {par_time:.2f}초")
     
     # 결과 비교
@@ -219,23 +125,35 @@ def compare_performance(startup_name: str):
     print("=" * 70)
 
 
-if __name__ == "__main__":
-    import sys
-    
+def compare_performance(startup_name: str):
+    """순차 vs 병렬 성능 비교 (동기 진입점)"""
+    asyncio.run(acompare_performance(startup_name))
+
+
+async def amain(argv: List[str]):
+    """
+    CLI 진입점 - 입력 대기(input)는 스레드에서 수행해 이벤트 루프를 막지 않음
+    (langgraph dev 등 이미 루프가 돌고 있는 환경에서도 그대로 await 가능)
+    """
     # 성능 비교 모드
-    if len(sys.argv) > 1 and sys.argv[1] == "--compare":
-        startup = input("성능 비교할 교육 스타트업 이름: ").strip()
+    if len(argv) > 1 and argv[1] == "--compare":
+        startup = (await asyncio.to_thread(input, "성능 비교할 교육 스타트업 이름: ")).strip()
         if startup:
-            compare_performance(startup)
-        sys.exit(0)
+            await acompare_performance(startup)
+        return
     
-    # 일반 실행 모드
-    startup = input("분석할 교육 AI 스타트업 이름: ").strip()
+    # 일반 실행 모드 (--batch: 6개 영역을 한 번의 LLM 호출로 평가)
+    # 쉼표로 여러 이름을 입력하면 스타트업들을 동시에 분석
+    startup = (await asyncio.to_thread(input, "분석할 교육 AI 스타트업 이름 (여러 개는 쉼표로 구분): ")).strip()
+    startups = [name.strip() for name in startup.split(",") if name.strip()]
     
-    if not startup:
+    if not startups:
         print("❌ 스타트업 이름을 입력해주세요.")
+    elif len(startups) > 1:
+        await arun_investment_analyses(startups, batch="--batch" in argv)
     else:
-        result = run_investment_analysis(startup)
+        startup = startups[0]
+        result = await arun_investment_analysis(startup, batch="--batch" in argv)
         
         # 보고서 미리보기
         print("\n" + "=" * 70)
@@ -243,4 +161,12 @@ if __name__ == "__main__":
         print("=" * 70)
         preview = result["report"][:1000]
         print(preview + "..." if len(result["report"]) > 1000 else preview)
-        print("=" * 70)
\ No newline at end of file
+        print("=" * 70)
+
+
+if __name__ == "__main__":
+    import sys
+    
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    asyncio.run(amain(sys.argv))
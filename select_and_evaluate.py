@@ -1,14 +1,35 @@
 import os
 import re
-import requests
+import csv
+import sys
+import hashlib
+import asyncio
+import httpx
+import tiktoken
 import pandas as pd
 import random
 import json
+import threading
 import time # [💡] 대기 시간 사용 위해 추가
-from typing import List, Set, Dict, Optional
+from pathlib import Path
+from functools import lru_cache
+from collections import Counter
+from typing import AsyncIterator, List, Set, Dict, Optional, Tuple
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 from rich import print
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential, wait_random
+
+# orjson (선택적 import) - Tavily/LLM 응답 JSON 파싱을 C 구현으로 가속, 없으면 표준 json 사용
+# (orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스라 예외 처리는 그대로 동작)
+# 캐시 값 직렬화도 orjson 사용 (UTF-8 bytes, 비 ASCII 문자 그대로) - 캐시 키는 표준 json으로 고정
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps_bytes = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+    json_dumps_bytes = lambda value: json.dumps(value, ensure_ascii=False).encode("utf-8")
 
 # === ① 환경 변수 로드 ===
 load_dotenv()
@@ -20,8 +41,79 @@ if not TAVILY_API_KEY:
 if not OPENAI_API_KEY:
     raise ValueError("🚨 OpenAI API key missing (.env).")
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+# [💡] 일시적 오류(429, 5xx, 연결 오류) 재시도 횟수 - OpenAI SDK는 자체적으로 지수 백오프 재시도를 수행
+API_MAX_RETRIES = 3
+client = OpenAI(api_key=OPENAI_API_KEY, max_retries=API_MAX_RETRIES)
+aclient = AsyncOpenAI(api_key=OPENAI_API_KEY, max_retries=API_MAX_RETRIES)
+# [💡] OPENAI_BATCH_MODE=1 이면 LLM 요청을 Batch API로 제출 (비용 50% 절감, 결과는 최대 24시간 내 수신)
+USE_BATCH_API = os.getenv("OPENAI_BATCH_MODE") == "1"
+BATCH_POLL_INTERVAL = 30  # Batch 상태 확인 간격 (초)
 TAVILY_URL = "https://api.tavily.com/search"
+# [💡] Tavily 요청 공통 헤더 + 연결 재사용 (요청마다 TCP/TLS 핸드셰이크 반복 방지)
+#      목록 생성/상세 평가 모두 httpx.AsyncClient 하나를 공유해 동시에 요청
+TAVILY_HEADERS = {"Authorization": f"Bearer {TAVILY_API_KEY}", "Content-Type": "application/json"}
+TAVILY_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+
+def is_transient_error(exc: BaseException) -> bool:
+    """재시도할 가치가 있는 오류인지 (연결/타임아웃 오류, 429, 5xx)"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+# [💡] 429 응답의 Retry-After(초)를 따를 때 기다릴 최대 시간 (비정상적으로 긴 값에 파이프라인이 묶이지 않도록)
+MAX_RETRY_AFTER = 60
+_backoff_wait = wait_exponential(multiplier=1, max=10) + wait_random(0, 1)
+
+def wait_backoff_or_retry_after(retry_state) -> float:
+    """지수 백오프 대기 시간 - 서버가 Retry-After를 보냈다면 그보다 일찍 재시도하지 않음"""
+    backoff = _backoff_wait(retry_state)
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, httpx.HTTPStatusError):
+        retry_after = exc.response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return max(backoff, min(float(retry_after), MAX_RETRY_AFTER))
+    return backoff
+
+# Tavily 요청용 재시도 정책 (최대 3회, 1초부터 최대 10초까지 지수 백오프 + 0~1초 jitter)
+# [💡] jitter로 동시에 실패한 스레드/코루틴들이 같은 시각에 몰려서 재시도하지 않도록 분산
+tavily_retry = retry(
+    stop=stop_after_attempt(API_MAX_RETRIES),
+    wait=wait_backoff_or_retry_after,
+    retry=retry_if_exception(is_transient_error),
+    reraise=True,
+)
+
+# [💡] Tavily 검색 결과/GPT 평가 결과 디스크 캐시 (같은 후보로 재실행 시 API 비용 절감)
+#      --no-cache 인자 또는 CACHE_DISABLE=1 이면 사용하지 않음
+CACHE_DIR = Path(os.getenv("EVAL_CACHE_DIR", ".cache"))
+CACHE_TTL = int(os.getenv("EVAL_CACHE_TTL", "86400"))  # 캐시 유지 시간 (초, 파일 수정 시각 기준)
+CACHE_DISABLED = "--no-cache" in sys.argv or os.getenv("CACHE_DISABLE") == "1"
+
+def cache_key(obj) -> str:
+    return hashlib.sha256(json.dumps(obj, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+def cache_get(namespace: str, key: str) -> Optional[dict]:
+    """TTL 이내의 캐시 값 반환 (없거나 만료/손상되면 None)"""
+    if CACHE_DISABLED:
+        return None
+    path = CACHE_DIR / namespace / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime >= CACHE_TTL:
+            return None
+        return json_loads(path.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+def cache_set(namespace: str, key: str, value: dict) -> None:
+    if CACHE_DISABLED:
+        return
+    path = CACHE_DIR / namespace / f"{key}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # 임시 파일에 쓴 뒤 교체 (동시에 실행 중인 스레드가 쓰다 만 파일을 읽지 않도록)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(json_dumps_bytes(value))
+    os.replace(tmp_path, path)
+
 STARTUP_CSV_FILE = "ai_filtered_startups.csv"
 # [💡💡💡] 순위 결과를 저장할 새 CSV 파일명
 RANKED_CSV_FILE = "ranked_startup_evaluations.csv"
@@ -35,16 +127,19 @@ AGGREGATION_QUERIES = [
 ]
 
 # === ②-2. 스타트업 목록 생성을 위한 정규식 + 필터 ===
+# [💡] 단어 길이(최대 31자)와 단어 사이 공백(1칸)을 제한해 긴 기사 본문에서도 백트래킹이 선형으로 유지되도록 함
 NAME_PATTERN = re.compile(
-    r"\b([A-Z][A-Za-z0-9&'\-]*(?:\s+[A-Z][A-Za-z0-9&'\-]*){0,2})\b"
+    r"\b[A-Z][A-Za-z0-9&'\-]{0,30}(?:\s[A-Z][A-Za-z0-9&'\-]{0,30}){0,2}\b"
 )
-STOPWORDS = {
+YEAR_PATTERN = re.compile(r"\d{4}")
+# [💡] 후보 이름을 대문자로 바꿔 비교하므로 불용어도 대문자로 정규화해 frozenset으로 고정
+STOPWORDS = frozenset(word.upper() for word in {
     "AI", "Labs", "Learning", "Education", "EdTech", "Systems", "Company", "Group",
     "Technology", "Technologies", "Platform", "Startup", "News", "Report", "Top",
     "Software", "Tools", "Adaptive", "Artificial", "Intelligence", "Market",
     "Overview", "Trend", "Global", "Data", "Model", "Classroom", "Program", "School",
     "South", "Korea", "Best", "List", "World",
-}
+})
 
 # === ②-3. 스타트업 평가 기준 (비즈니스 성장 중심) ===
 EVALUATION_CRITERIA = {
@@ -94,74 +189,205 @@ EVALUATION_CRITERIA = {
 
 
 # === ③-1. Tavily 검색 함수 (목록 생성용) ===
-def tavily_search_for_aggregation(query: str, max_results: int = 40) -> dict:
-    headers = {"Authorization": f"Bearer {TAVILY_API_KEY}", "Content-Type": "application/json"}
+@tavily_retry
+async def post_tavily_async(client: httpx.AsyncClient, payload: dict) -> dict:
+    res = await client.post(TAVILY_URL, json=payload, timeout=30)
+    res.raise_for_status()
+    return json_loads(res.content)
+
+# [💡] 목록 생성/상세 평가 공용 - 같은 요청은 CACHE_TTL 동안 디스크 캐시에서 재사용
+async def post_tavily(client: httpx.AsyncClient, payload: dict) -> dict:
+    key = cache_key(payload)
+    cached = cache_get("tavily", key)
+    if cached is not None:
+        return cached
+    data = await post_tavily_async(client, payload)
+    cache_set("tavily", key, data)
+    return data
+
+async def tavily_search_for_aggregation(client: httpx.AsyncClient, query: str, max_results: int = 40) -> dict:
     payload = { "query": query, "max_results": min(max_results, 50), "include_answer": True, "search_depth": "advanced" }
     try:
-        res = requests.post(TAVILY_URL, json=payload, headers=headers, timeout=30)
-        res.raise_for_status()
-        return res.json()
-    except requests.exceptions.RequestException as e:
+        return await post_tavily(client, payload)
+    except httpx.HTTPError as e:
         print(f"❌ (목록 생성) Tavily 검색 실패({query}): {e}")
         return {}
     except Exception as e:
          print(f"❌ (목록 생성) Tavily 처리 중 오류({query}): {e}")
          return {}
 
+# [💡] 목록 생성 쿼리들은 서로 독립적이므로 한 클라이언트로 동시에 요청 (4×RTT → 약 1×RTT)
+#      먼저 도착한 응답부터 반환해 이름 추출(CPU)이 나머지 응답 수신(네트워크)과 겹치도록 함
+async def iter_aggregation_results(queries: List[str]) -> AsyncIterator[dict]:
+    async with httpx.AsyncClient(headers=TAVILY_HEADERS, limits=TAVILY_LIMITS) as http_client:
+        tasks = [tavily_search_for_aggregation(http_client, q) for q in queries]
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+
 # === ③-2. 이름 후보 추출 함수 ===
+# [💡] 여러 텍스트를 하나로 이어 정규식을 한 번만 실행 (구분자 \x00은 공백이 아니라 이름이 텍스트 경계를 넘어 이어지지 않음)
+TEXT_SEPARATOR = "\x00"
+
 def extract_candidate_names(*texts: str) -> Set[str]:
-    candidates: Set[str] = set()
-    for text in texts:
-        if not text: continue
-        for match in NAME_PATTERN.findall(text):
-            name = match.strip()
-            if (len(name) < 3 or name.upper() in STOPWORDS or
-                not any(c.islower() for c in name if c.isalpha()) or
-                len(name.split()) > 3 or
-                not re.match(r"^[A-Z]", name) or
-                re.search(r'\d{4}', name)):
-                continue
-            candidates.add(name)
-    return candidates
-
-# === ③-3. AI 필터 함수 (GPT로 실제 기업명만 남김) ===
-def ai_filter_startups(candidates: List[str]) -> List[str]:
-    if not candidates: return []
+    # NAME_PATTERN이 대문자로 시작하고 앞뒤 공백이 없는 최대 3단어 매치만 반환하므로
+    # strip/대문자/단어 수 재검사 생략, 나머지 조건은 비용이 낮은 순서로 검사
+    # 중복을 먼저 제거한 뒤 고유 이름에만 필터 적용
+    matches = set(NAME_PATTERN.findall(TEXT_SEPARATOR.join(text for text in texts if text)))
+    return {
+        name for name in matches
+        if not (len(name) < 3 or name.upper() in STOPWORDS or
+                name.isupper() or
+                YEAR_PATTERN.search(name))
+    }
+
+# === ③-3. OpenAI Batch API 제출 함수 ===
+def run_chat_batch(bodies: List[dict]) -> List[Optional[str]]:
+    """
+    chat.completions 요청 본문 목록을 하나의 Batch로 제출하고 완료될 때까지 대기
+    반환: 요청 순서대로 응답 텍스트 (실패한 요청은 None)
+    """
+    lines = [
+        json.dumps({"custom_id": str(i), "method": "POST", "url": "/v1/chat/completions", "body": body}, ensure_ascii=False)
+        for i, body in enumerate(bodies)
+    ]
+    batch_file = client.files.create(file=("batch.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch")
+    batch = client.batches.create(input_file_id=batch_file.id, endpoint="/v1/chat/completions", completion_window="24h")
+    print(f"  📦 Batch 제출 완료 ({len(bodies)}건, id={batch.id}) - 완료 대기 중...")
+
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(BATCH_POLL_INTERVAL)
+        batch = client.batches.retrieve(batch.id)
+
+    outputs: List[Optional[str]] = [None] * len(bodies)
+    if batch.status != "completed" or not batch.output_file_id:
+        print(f"  ❌ Batch 처리 실패 (status={batch.status})")
+        return outputs
+
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        item = json_loads(line)
+        response = item.get("response") or {}
+        if response.get("status_code") == 200:
+            outputs[int(item["custom_id"])] = response["body"]["choices"][0]["message"]["content"]
+    return outputs
+
+# === ③-4. AI 필터 함수 (GPT로 실제 기업명만 남김) ===
+# [💡] AI 필터 1회 요청당 후보 이름 수 (청크들은 동시에 요청)
+FILTER_CHUNK_SIZE = 50
+# [💡] AI 필터로 보낼 최대 후보 수 - 여러 검색 응답에 자주 등장한 이름부터 남기고 한 번만 나온 잡음은 제외
+MAX_FILTER_CANDIDATES = int(os.getenv("MAX_FILTER_CANDIDATES", "200"))
+# 중복 판단 시 무시할 법인/일반 접미사 ("Riiid Inc" == "RIIID" == "Riiid")
+LEGAL_SUFFIX_PATTERN = re.compile(r"[\s,]+(?:inc|corp|co|ltd|llc|labs|ai)\.?$", re.IGNORECASE)
+# 단어 사이 문장부호/연속 공백은 공백 하나로 통일 ("Sana-Labs" == "Sana  Labs")
+NAME_SEPARATOR_PATTERN = re.compile(r"[\s\-_'&.,!?]+")
+
+def normalize_name(name: str) -> str:
+    """중복 판단용 이름 키 (소문자화 + 문장부호/공백 통일 + 접미사 제거)"""
+    key = NAME_SEPARATOR_PATTERN.sub(" ", name.casefold()).strip()
+    while True:
+        stripped = LEGAL_SUFFIX_PATTERN.sub("", key)
+        if stripped == key or not stripped:
+            return key
+        key = stripped
+
+def dedupe_candidates(candidates: List[str]) -> List[str]:
+    """정규화 키가 같은 후보는 처음 나온 표기 하나만 남김"""
+    unique: Dict[str, str] = {}
+    for name in candidates:
+        unique.setdefault(normalize_name(name), name)
+    return list(unique.values())
+
+# [💡] AI 필터 전 로컬 사전 필터 - 뉴스 제목 조각/모음 없는 약어 등 회사 이름일 수 없는 후보를 미리 제거해 프롬프트 축소
+NEWS_WORD_PATTERN = re.compile(
+    r"\b(?:announces?|raises?|raised|launch(?:es|ed)?|secures?|secured|acquires?|acquired|partners?|"
+    r"report|reports|news|funding|series|round|billion|million|startups?|top|best|how|why|what)\b",
+    re.IGNORECASE,
+)
+VOWEL_PATTERN = re.compile(r"[aeiouy]", re.IGNORECASE)
+
+def pre_filter(names: List[str]) -> List[str]:
+    """회사 이름 형태가 아닌 후보 제거 (길이 3~30, 모음 포함, 뉴스성 단어 미포함)"""
+    return [
+        name for name in names
+        if 3 <= len(name) <= 30 and VOWEL_PATTERN.search(name) and not NEWS_WORD_PATTERN.search(name)
+    ]
+
+def build_filter_request(candidates: List[str]) -> dict:
     prompt = f"""다음 리스트에서 실제 'AI 기반 교육(EdTech) 스타트업' 또는 관련 기업의 이름만 정확히 추출해주세요. 뉴스 제목의 일부, 일반 명사, 기술 용어, 인물/도시 이름, 보고서 제목 등은 모두 제외하고 오직 회사 이름만 남겨야 합니다. 결과는 회사 이름만 한 줄에 하나씩 나열해주세요. 중복은 제거해주세요.
 리스트: {', '.join(candidates)}"""
+    return {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": prompt}], "temperature": 0}
+
+async def _filter_chunk(body: dict) -> str:
+    response = await aclient.chat.completions.create(**body)
+    return response.choices[0].message.content
+
+async def ai_filter_startups(candidates: List[str]) -> List[str]:
+    if not candidates: return []
+    names = pre_filter(dedupe_candidates(candidates))
+    if not names: return []
+    chunks = [names[i:i + FILTER_CHUNK_SIZE] for i in range(0, len(names), FILTER_CHUNK_SIZE)]
+    bodies = [build_filter_request(chunk) for chunk in chunks]
+    print(f"  🧹 중복 제거/사전 필터 후 후보 {len(names)}개 → {len(chunks)}개 청크로 필터링")
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini", messages=[{"role": "user", "content": prompt}], temperature=0
-        )
-        text = response.choices[0].message.content.strip()
-        return sorted(list(set(line.strip() for line in text.splitlines() if line.strip() and len(line.strip()) > 1)))
+        if USE_BATCH_API:
+            # 모든 청크를 하나의 Batch로 제출 (블로킹 폴링이므로 스레드에서 실행)
+            texts = await asyncio.to_thread(run_chat_batch, bodies)
+            if any(text is None for text in texts):
+                raise RuntimeError("Batch 응답 누락")
+        else:
+            texts = await asyncio.gather(*[_filter_chunk(body) for body in bodies])
+        lines = (line.strip() for text in texts for line in text.strip().splitlines())
+        return sorted(set(dedupe_candidates([line for line in lines if len(line) > 1])))
     except Exception as e:
         print(f"⚠️ AI 필터 실패: {e}. 원본 후보 반환.")
-        return sorted(list(set(candidates)))
-
-# === ③-4. 전체 스타트업 목록 생성 및 저장 함수 ===
-def generate_and_save_startup_list(output_csv: str) -> List[str]:
-    print("[bold blue]=== 🚀 1단계: AI EdTech 스타트업 목록 생성 시작 ===[/]")
-    all_candidates: Set[str] = set()
+        return sorted(set(names))
+
+# === ③-5. 전체 스타트업 목록 생성 및 저장 함수 ===
+async def collect_and_filter_startups() -> List[str]:
+    """목록 생성 쿼리 검색 → 이름 후보 추출 → AI 필터 (하나의 이벤트 루프에서 실행)"""
+    # [💡] 정규화 키 → 처음 나온 표기 ("Riiid", "Riiid Inc", "RIIID"가 후보 하나로 합쳐져 필터 프롬프트가 짧아짐)
+    all_candidates: Dict[str, str] = {}
+    # 정규화 키별로 몇 개의 검색 응답에 등장했는지 (후보 상한 적용 시 우선순위)
+    mention_counts: Counter = Counter()
     for q in AGGREGATION_QUERIES:
         print(f"  🔍 Searching: {q}")
-        data = tavily_search_for_aggregation(q)
+    async for data in iter_aggregation_results(AGGREGATION_QUERIES):
         if not data: continue
-        all_candidates.update(extract_candidate_names(data.get("answer", "")))
+        # 응답 하나의 모든 텍스트(요약 + 각 결과의 제목/본문)를 한 번에 추출
+        texts = [data.get("answer", "")]
         for r in data.get("results", []):
-            all_candidates.update(extract_candidate_names(r.get("title", ""), r.get("content", "")))
+            texts.extend((r.get("title", ""), r.get("content", "")))
+        keys = set()
+        for name in extract_candidate_names(*texts):
+            key = normalize_name(name)
+            all_candidates.setdefault(key, name)
+            keys.add(key)
+        mention_counts.update(keys)
 
     print(f"  🧩 1차 추출된 후보 수: {len(all_candidates)}")
     if not all_candidates:
          print("  ❌ 1차 추출된 후보가 없습니다. 쿼리를 확인하세요.")
          return []
 
+    if len(all_candidates) > MAX_FILTER_CANDIDATES:
+        print(f"  ✂️ 등장 빈도 상위 {MAX_FILTER_CANDIDATES}개 후보만 AI 필터에 전달")
+    candidates = [all_candidates[key] for key, _ in mention_counts.most_common(MAX_FILTER_CANDIDATES)]
+
     print("  🤖 AI 필터링 진행 중...")
-    filtered_startups = ai_filter_startups(sorted(list(all_candidates)))
+    return await ai_filter_startups(sorted(candidates))
+
+def save_startup_csv(output_csv: str, startup_names: List[str]) -> None:
+    # 이름 한 열뿐이라 DataFrame 없이 한 줄씩 기록 (엑셀 호환을 위해 utf-8-sig 유지)
+    with open(output_csv, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["startup_name"])
+        writer.writerows([name] for name in startup_names)
+
+def generate_and_save_startup_list(output_csv: str) -> List[str]:
+    print("[bold blue]=== 🚀 1단계: AI EdTech 스타트업 목록 생성 시작 ===[/]")
+    filtered_startups = asyncio.run(collect_and_filter_startups())
 
     if filtered_startups:
-        df = pd.DataFrame(filtered_startups, columns=["startup_name"])
-        df.to_csv(output_csv, index=False, encoding="utf-8-sig")
+        save_startup_csv(output_csv, filtered_startups)
         print(f"  ✅ 최종 {len(filtered_startups)}개 스타트업 저장 완료 → {output_csv}")
         print("  --- 최종 목록 ---")
         for s in filtered_startups: print(f"  - {s}")
@@ -169,26 +395,72 @@ def generate_and_save_startup_list(output_csv: str) -> List[str]:
         return filtered_startups
     else:
         print(f"  ❌ AI 필터링 후 남은 스타트업이 없습니다.")
-        pd.DataFrame(columns=["startup_name"]).to_csv(output_csv, index=False, encoding="utf-8-sig")
+        save_startup_csv(output_csv, [])
         return []
 
+# === ④-0. 상세 평가 전 간이 투자 매력도 사전 선별 ===
+# [💡] 상세 평가(검색 + 긴 프롬프트)는 비싸므로 이름만으로 1~10점을 한 번에 매겨 상위 K개만 상세 평가
+PRESCREEN_TOP_K = int(os.getenv("PRESCREEN_TOP_K", "20"))
+
+def prescreen(names: List[str]) -> List[Tuple[str, int]]:
+    """
+    모든 후보 이름을 한 번의 호출로 간이 채점 (1~10점, 점수 내림차순 반환)
+    실패 시 원래 순서 그대로 0점으로 반환
+    """
+    prompt = f"""다음 교육(EdTech) 스타트업들의 투자 매력도를 알고 있는 정보만으로 1~10점 정수로 간단히 평가해주세요.
+결과는 {{"스타트업 이름": 점수}} 형태의 JSON 객체로만 응답하고, 이름은 입력과 똑같이 적어주세요.
+스타트업 목록: {', '.join(names)}"""
+    try:
+        response = client.chat.completions.create(
+            model="gpt-4o-mini", messages=[{"role": "user", "content": prompt}],
+            temperature=0, response_format={"type": "json_object"}
+        )
+        scores = json_loads(response.choices[0].message.content)
+        ranked = [(name, int(scores.get(name, 0) or 0)) for name in names]
+        # sorted는 안정 정렬이므로 동점이면 원래 순서 유지
+        return sorted(ranked, key=lambda item: item[1], reverse=True)
+    except Exception as e:
+        print(f"⚠️ 사전 선별 실패: {e}. 전체 후보를 그대로 사용합니다.")
+        return [(name, 0) for name in names]
+
 # === ④-1. Tavily로 상세 평가용 컨텍스트 검색 함수 ===
-def get_startup_context_for_eval(startup_name: str, max_results: int = 7) -> str:
+# [💡] 상세 평가 프롬프트에 넣을 컨텍스트 토큰 상한 (글자 수가 아닌 토큰 기준, 출처 블록 단위로 자름)
+EVAL_CONTEXT_MAX_TOKENS = 6000
+
+@lru_cache(maxsize=1)
+def token_encoding() -> tiktoken.Encoding:
+    # 첫 사용 시 BPE 파일을 내려받으므로 import 시점이 아니라 처음 필요할 때 로드
+    return tiktoken.encoding_for_model("gpt-4o-mini")
+
+def truncate_context(parts: List[str], max_tokens: int) -> str:
+    """출처 블록을 순서대로 토큰 예산 안에서만 결합 (첫 블록이 예산을 넘으면 토큰 단위로 자름)"""
+    encoding = token_encoding()
+    kept, used = [], 0
+    for part in parts:
+        tokens = encoding.encode(part)
+        if used + len(tokens) > max_tokens:
+            if not kept:
+                kept.append(encoding.decode(tokens[:max_tokens]))
+            break
+        kept.append(part)
+        used += len(tokens)
+    return "\n".join(kept)
+
+async def get_startup_context_for_eval(client: httpx.AsyncClient, startup_name: str, max_results: int = 7) -> str:
     print(f"  🔍 '{startup_name}' 상세 정보 검색 중 (Tavily)...")
-    headers = {"Authorization": f"Bearer {TAVILY_API_KEY}", "Content-Type": "application/json"}
     query = f"{startup_name} EdTech company overview funding technology business model market size competition recent news"
     payload = { "query": query, "max_results": max_results, "include_answer": True, "search_depth": "advanced" }
     try:
-        res = requests.post(TAVILY_URL, json=payload, headers=headers, timeout=30)
-        res.raise_for_status()
-        data = res.json()
+        data = await post_tavily(client, payload)
         context_parts = []
+        seen_contents = set()  # 같은 본문이 여러 출처로 중복 수집되면 한 번만 포함
         if data.get("answer"): context_parts.append(f"Tavily 요약:\n{data['answer']}")
         if data.get("results"):
             for i, result in enumerate(data["results"]):
                 title = result.get("title", "N/A")
                 content = result.get("content", "N/A")
-                if content and len(content) > 50:
+                if content and len(content) > 50 and content not in seen_contents:
+                    seen_contents.add(content)
                     context_parts.append(f"\n출처 {i+1} ({title}):\n{content}")
 
         if not context_parts:
@@ -196,10 +468,9 @@ def get_startup_context_for_eval(startup_name: str, max_results: int = 7) -> str
              return "검색된 상세 정보 없음."
 
         print(f"  ✅ '{startup_name}' 상세 정보 검색 완료 ({len(context_parts)}개 출처).")
-        full_context = "\n".join(context_parts)
-        return full_context[:15000]
+        return truncate_context(context_parts, EVAL_CONTEXT_MAX_TOKENS)
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"  ❌ (상세 검색) Tavily 네트워크 오류: {e}")
         return f"Tavily 상세 검색 실패: {e}"
     except Exception as e:
@@ -207,20 +478,22 @@ def get_startup_context_for_eval(startup_name: str, max_results: int = 7) -> str
         return f"Tavily 상세 검색 실패: {e}"
 
 # === ④-2. AI 상세 평가 함수 ===
-def evaluate_startup_with_ai(startup_name: str, context: str, criteria: Dict[str, List[str]]) -> Optional[Dict]:
-    print(f"  🤖 '{startup_name}' 상세 평가 시작 (GPT-4o-mini)...")
-    criteria_prompt_text = ""
-    for category, questions in criteria.items():
-        criteria_prompt_text += f"\n### {category.upper()} 평가 기준:\n" + "\n".join(f"- {q}" for q in questions)
-
-    prompt = f"""
+def format_criteria(criteria: Dict[str, List[str]]) -> str:
+    return "".join(
+        f"\n### {category.upper()} 평가 기준:\n" + "\n".join(f"- {q}" for q in questions)
+        for category, questions in criteria.items()
+    )
+
+# [💡] 평가 기준 텍스트와 프롬프트 틀은 모듈 로드 시 한 번만 생성 (호출마다 이름/컨텍스트만 치환)
+CRITERIA_PROMPT_TEXT = format_criteria(EVALUATION_CRITERIA)
+EVALUATION_PROMPT_TEMPLATE = """
 당신은 매우 꼼꼼한 EdTech VC 투자 심사역입니다. 주어진 스타트업 '{startup_name}'에 대한 정보(Context)를 바탕으로 다음 평가 기준들을 **종합적으로 고려**하여 분석해주세요.
 
 **Context:**
 {context}
 ---
 **평가 기준:**
-{criteria_prompt_text}
+{criteria}
 ---
 **분석 요청:**
 위 Context와 평가 기준들을 바탕으로, **각 6가지 카테고리(technology, learning_effectiveness, market, competition, growth_potential, risk)별**로 스타트업이 얼마나 우수한지 **종합적인 분석**을 1-2 문장으로 작성하고, **1점에서 5점 사이의 점수**를 매겨주세요. (5점이 가장 우수함. 단, risk는 점수가 높을수록 리스크가 낮음을 의미)
@@ -239,27 +512,237 @@ def evaluate_startup_with_ai(startup_name: str, context: str, criteria: Dict[str
   "overall_assessment": "종합 투자 의견..."
 }}
 """
+
+# [💡] 스타트업 1개 평가 응답의 최대 출력 토큰 (정상 응답은 한국어 분석 포함 약 500~800토큰)
+#      비정상적으로 긴 생성을 끊어 지연/비용 상한을 고정 - 잘린 응답은 JSON이 깨지므로 실패로 처리
+EVAL_MAX_OUTPUT_TOKENS = 1000
+
+# [💡] 여러 스타트업을 한 프롬프트로 묶어 평가 (EVAL_GROUP_SIZE > 1일 때) - 평가 기준/지시문을 한 번만 보내 입력 토큰 절감
+#      스타트업별 컨텍스트는 이미 EVAL_CONTEXT_MAX_TOKENS로 제한되어 있어 6개 묶음도 모델 컨텍스트 한도 안에 들어감
+EVAL_GROUP_SIZE = int(os.getenv("EVAL_GROUP_SIZE", "1"))
+GROUP_EVALUATION_PROMPT_TEMPLATE = """
+당신은 매우 꼼꼼한 EdTech VC 투자 심사역입니다. 아래 {count}개 스타트업 각각에 대한 정보(Context)를 바탕으로 다음 평가 기준들을 **종합적으로 고려**하여 **스타트업마다 독립적으로** 분석해주세요. 다른 스타트업의 Context를 섞어 판단하지 마세요.
+
+**평가 기준:**
+{criteria}
+---
+{startups}
+---
+**분석 요청:**
+각 스타트업마다 **6가지 카테고리(technology, learning_effectiveness, market, competition, growth_potential, risk)별**로 스타트업이 얼마나 우수한지 **종합적인 분석**을 1-2 문장으로 작성하고, **1점에서 5점 사이의 점수**를 매겨주세요. (5점이 가장 우수함. 단, risk는 점수가 높을수록 리스크가 낮음을 의미)
+
+**출력 형식 (오직 JSON 객체만 출력, 다른 설명 절대 금지, evaluations는 위 스타트업 순서대로):**
+{{
+  "evaluations": [
+    {{
+      "startup_name": "스타트업 이름 (위와 똑같이)",
+      "evaluation_summary": {{
+        "technology": {{ "analysis": "...", "score": 점수(1-5) }},
+        "learning_effectiveness": {{ "analysis": "...", "score": 점수(1-5) }},
+        "market": {{ "analysis": "...", "score": 점수(1-5) }},
+        "competition": {{ "analysis": "...", "score": 점수(1-5) }},
+        "growth_potential": {{ "analysis": "...", "score": 점수(1-5) }},
+        "risk": {{ "analysis": "...", "score": 점수(1-5) }}
+      }},
+      "overall_assessment": "종합 투자 의견..."
+    }}
+  ]
+}}
+"""
+
+def build_evaluation_request(startup_name: str, context: str, criteria: Dict[str, List[str]]) -> dict:
+    """상세 평가용 chat.completions 요청 본문 (일반 호출/Batch 제출 공용)"""
+    criteria_prompt_text = CRITERIA_PROMPT_TEXT if criteria is EVALUATION_CRITERIA else format_criteria(criteria)
+    prompt = EVALUATION_PROMPT_TEMPLATE.format(startup_name=startup_name, context=context, criteria=criteria_prompt_text)
+    return {
+        "model": "gpt-4o-mini", "messages": [{"role": "user", "content": prompt}],
+        "temperature": 0.1, "response_format": {"type": "json_object"},
+        "max_tokens": EVAL_MAX_OUTPUT_TOKENS
+    }
+
+def parse_evaluation(result_json: str) -> Optional[Dict]:
+    """AI 평가 응답(JSON) 파싱 - 구조가 맞지 않으면 None"""
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini", messages=[{"role": "user", "content": prompt}],
-            temperature=0.1, response_format={"type": "json_object"}
-        )
+        parsed_result = json_loads(result_json)
+        if "evaluation_summary" in parsed_result and "overall_assessment" in parsed_result:
+             return parsed_result
+        else:
+             print(f"  ❌ AI 평가 JSON 구조 오류. 원본 응답:\n{result_json}")
+             return None
+    except json.JSONDecodeError as e:
+        print(f"  ❌ AI 평가 JSON 파싱 실패: {e}. 원본 응답:\n{result_json}")
+        return None
+
+async def evaluate_startup_with_ai(startup_name: str, context: str, criteria: Dict[str, List[str]]) -> Optional[Dict]:
+    body = build_evaluation_request(startup_name, context, criteria)
+    key = cache_key(body)
+    cached = cache_get("llm", key)
+    if cached is not None:
+        print(f"  ♻️ '{startup_name}' 캐시된 평가 결과 사용.")
+        return cached
+
+    print(f"  🤖 '{startup_name}' 상세 평가 시작 (GPT-4o-mini)...")
+    try:
+        response = await aclient.chat.completions.create(**body)
+        if response.choices[0].finish_reason == "length":
+            print(f"  ❌ '{startup_name}' 평가 응답이 최대 토큰({EVAL_MAX_OUTPUT_TOKENS})에서 잘렸습니다.")
+            return None
         result_json = response.choices[0].message.content
         print(f"  ✅ '{startup_name}' 상세 평가 완료.")
-        try:
-            parsed_result = json.loads(result_json)
-            if "evaluation_summary" in parsed_result and "overall_assessment" in parsed_result:
-                 return parsed_result
-            else:
-                 print(f"  ❌ AI 평가 JSON 구조 오류. 원본 응답:\n{result_json}")
-                 return None
-        except json.JSONDecodeError as e:
-            print(f"  ❌ AI 평가 JSON 파싱 실패: {e}. 원본 응답:\n{result_json}")
-            return None
+        evaluation = parse_evaluation(result_json)
+        if evaluation is not None:
+            cache_set("llm", key, evaluation)
+        return evaluation
     except Exception as e:
         print(f"  ❌ AI 평가 중 오류 발생: {e}")
         return None
 
+def split_cached_evaluations(names_with_contexts: List[Tuple[str, str]], namespace: str = "llm") -> Tuple[Dict[str, Optional[Dict]], list]:
+    """
+    캐시된 평가 결과와 새로 평가할 항목 분리 (namespace: 평가 방식별 캐시 구분)
+    반환: ({이름: 캐시된 결과}, [(이름, 캐시 키, 요청 본문)])
+    """
+    results: Dict[str, Optional[Dict]] = {}
+    pending = []
+    for name, context in names_with_contexts:
+        body = build_evaluation_request(name, context, EVALUATION_CRITERIA)
+        key = cache_key(body)
+        cached = cache_get(namespace, key)
+        if cached is not None:
+            results[name] = cached
+        else:
+            pending.append((name, key, body))
+    return results, pending
+
+def evaluate_startup_batch(names_with_contexts: List[Tuple[str, str]]) -> Dict[str, Optional[Dict]]:
+    """
+    여러 스타트업의 상세 평가를 하나의 Batch로 제출 (OPENAI_BATCH_MODE=1)
+    반환: {스타트업 이름: 평가 결과 (실패 시 None)}
+    """
+    results, pending = split_cached_evaluations(names_with_contexts)  # 캐시에 없는 것만 Batch로 제출
+    if pending:
+        outputs = run_chat_batch([body for _, _, body in pending])
+        for (name, key, _), output in zip(pending, outputs):
+            evaluation = parse_evaluation(output) if output is not None else None
+            if evaluation is not None:
+                cache_set("llm", key, evaluation)
+            results[name] = evaluation
+    return results
+
+async def _evaluate_group(group: List[Tuple[str, str]]) -> List[Optional[Dict]]:
+    """스타트업 묶음을 한 번의 호출로 평가 (입력 순서대로 결과, 실패/누락은 None)"""
+    startups = "\n".join(
+        f"### 스타트업 {i}: {name}\n**Context:**\n{context}\n" for i, (name, context) in enumerate(group, 1)
+    )
+    prompt = GROUP_EVALUATION_PROMPT_TEMPLATE.format(count=len(group), criteria=CRITERIA_PROMPT_TEXT, startups=startups)
+    print(f"  🤖 {', '.join(name for name, _ in group)} 묶음 평가 시작 (GPT-4o-mini)...")
+    try:
+        response = await aclient.chat.completions.create(
+            model="gpt-4o-mini", messages=[{"role": "user", "content": prompt}],
+            temperature=0.1, response_format={"type": "json_object"},
+            max_tokens=EVAL_MAX_OUTPUT_TOKENS * len(group)
+        )
+        if response.choices[0].finish_reason == "length":
+            raise ValueError(f"응답이 최대 토큰({EVAL_MAX_OUTPUT_TOKENS * len(group)})에서 잘림")
+        evaluations = [e for e in json_loads(response.choices[0].message.content).get("evaluations", []) if isinstance(e, dict)]
+    except Exception as e:
+        print(f"  ❌ 묶음 평가 중 오류 발생: {e}")
+        return [None] * len(group)
+
+    # 이름으로 매칭하고, 이름이 다르게 적혔으면 개수가 맞을 때만 순서로 매칭
+    by_name = {e.get("startup_name"): e for e in evaluations}
+    results = []
+    for i, (name, _) in enumerate(group):
+        evaluation = by_name.get(name) or (evaluations[i] if len(evaluations) == len(group) else None)
+        if evaluation and "evaluation_summary" in evaluation and "overall_assessment" in evaluation:
+            evaluation["startup_name"] = name
+            results.append(evaluation)
+        else:
+            print(f"  ❌ '{name}' 묶음 평가 결과 누락")
+            results.append(None)
+    return results
+
+# [💡] 묶음 평가 결과는 다른 스타트업의 컨텍스트와 한 프롬프트에서 나온 답이므로
+#      단건 평가 캐시와 섞이지 않도록 별도 네임스페이스에 저장 (묶음 평가끼리만 재사용)
+GROUP_CACHE_NAMESPACE = "llm_group"
+
+async def evaluate_startups_grouped(names_with_contexts: List[Tuple[str, str]], semaphore: asyncio.Semaphore) -> Dict[str, Optional[Dict]]:
+    """
+    캐시에 없는 스타트업을 EVAL_GROUP_SIZE개씩 묶어 동시에 평가
+    반환: {스타트업 이름: 평가 결과 (실패 시 None)}
+    """
+    results, pending = split_cached_evaluations(names_with_contexts, GROUP_CACHE_NAMESPACE)
+    contexts = dict(names_with_contexts)
+    groups = [pending[i:i + EVAL_GROUP_SIZE] for i in range(0, len(pending), EVAL_GROUP_SIZE)]
+
+    async def run_group(group: list) -> None:
+        async with semaphore:
+            evaluations = await _evaluate_group([(name, contexts[name]) for name, _, _ in group])
+        for (name, key, _), evaluation in zip(group, evaluations):
+            if evaluation is not None:
+                cache_set(GROUP_CACHE_NAMESPACE, key, evaluation)
+            results[name] = evaluation
+
+    await asyncio.gather(*[run_group(group) for group in groups])
+    return results
+
+# === ④-3. 스타트업 평가 (상세 검색 → AI 평가 → 총점) ===
+# [💡] 동시에 평가할 스타트업 수 (Tavily/OpenAI 분당 요청 한도에 맞춰 조정)
+EVAL_MAX_WORKERS = int(os.getenv("EVAL_MAX_WORKERS", "8"))
+
+def context_failed(startup_context: str) -> bool:
+    return "실패" in startup_context or "없음" in startup_context
+
+def finalize_evaluation(startup_name: str, evaluation_result: Optional[Dict]) -> Dict:
+    """총점 계산 - 평가 실패면 error 필드와 총점 0을 담은 결과 반환"""
+    if not evaluation_result:
+        return {"startup_name": startup_name, "error": "Evaluation Failed", "total_score": 0}
+
+    evaluation_summary = evaluation_result.get("evaluation_summary") or {}
+    evaluation_result["total_score"] = sum(category_data.get("score", 0) for category_data in evaluation_summary.values())
+    return evaluation_result
+
+async def evaluate_one_startup(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, startup_name: str) -> Dict:
+    """스타트업 1개 평가 - 실패하면 error 필드와 총점 0을 담은 결과 반환"""
+    async with semaphore:
+        startup_context = await get_startup_context_for_eval(client, startup_name)
+        if context_failed(startup_context):
+            return {"startup_name": startup_name, "error": "Context Retrieval Failed", "total_score": 0}
+
+        evaluation_result = await evaluate_startup_with_ai(startup_name, startup_context, EVALUATION_CRITERIA)
+    return finalize_evaluation(startup_name, evaluation_result)
+
+async def _bounded_context(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, startup_name: str) -> str:
+    async with semaphore:
+        return await get_startup_context_for_eval(client, startup_name)
+
+async def evaluate_all_startups(startup_list: List[str]) -> List[Dict]:
+    """
+    모든 스타트업 평가 (입력 순서대로 결과 반환)
+    기본: 스타트업별 검색 + AI 평가를 한 이벤트 루프에서 동시에 실행 (최대 EVAL_MAX_WORKERS개)
+    OPENAI_BATCH_MODE=1: 검색만 동시에 하고 AI 평가는 하나의 Batch로 제출
+    EVAL_GROUP_SIZE > 1: 검색만 동시에 하고 AI 평가는 여러 스타트업을 한 프롬프트로 묶어 요청
+    """
+    semaphore = asyncio.Semaphore(EVAL_MAX_WORKERS)
+    async with httpx.AsyncClient(headers=TAVILY_HEADERS, limits=TAVILY_LIMITS) as http_client:
+        if not USE_BATCH_API and EVAL_GROUP_SIZE <= 1:
+            return await asyncio.gather(*[evaluate_one_startup(http_client, semaphore, name) for name in startup_list])
+        contexts = await asyncio.gather(*[_bounded_context(http_client, semaphore, name) for name in startup_list])
+
+    ready = [(name, ctx) for name, ctx in zip(startup_list, contexts) if not context_failed(ctx)]
+    if not ready:
+        evaluations = {}
+    elif USE_BATCH_API:
+        # Batch 폴링은 블로킹이므로 스레드에서 실행
+        evaluations = await asyncio.to_thread(evaluate_startup_batch, ready)
+    else:
+        evaluations = await evaluate_startups_grouped(ready, semaphore)
+    return [
+        finalize_evaluation(name, evaluations.get(name)) if not context_failed(ctx)
+        else {"startup_name": name, "error": "Context Retrieval Failed", "total_score": 0}
+        for name, ctx in zip(startup_list, contexts)
+    ]
+
 # === ⑤ 메인 실행 로직 (💡💡💡 순차 평가 -> 순위 저장 로직 추가 💡💡💡) ===
 if __name__ == "__main__":
     # 1단계: 스타트업 목록 생성 및 저장
@@ -267,49 +750,32 @@ if __name__ == "__main__":
 
     print("\n" + "="*60 + "\n")
 
-    # 2단계: 목록의 모든 스타트업 순차 평가 및 결과 저장
+    # 2단계: 목록의 모든 스타트업 병렬 평가 및 결과 저장
     all_evaluations: List[Dict] = [] # 모든 평가 결과를 저장할 리스트
 
     if not startup_list:
         print("[bold red]➡️ 생성된 스타트업 목록이 없어 상세 평가를 진행할 수 없습니다.[/]")
     else:
-        print(f"[bold blue]=== ✨ 2단계: 총 {len(startup_list)}개 스타트업 순차 상세 평가 시작 ===[/]")
-
-        for i, selected_startup in enumerate(startup_list):
-            print(f"\n[bold sky_blue1]⭐ ({i+1}/{len(startup_list)}) 평가 대상: {selected_startup} ⭐[/]")
-
-            startup_context = get_startup_context_for_eval(selected_startup)
-
-            evaluation_result = None # 평가 결과 초기화
-            if "실패" in startup_context or "없음" in startup_context:
-                print("  ❌ 컨텍스트 검색 실패 또는 정보 부족으로 평가를 건너<0xEB><0x9B><0x81>니다.")
-                all_evaluations.append({"startup_name": selected_startup, "error": "Context Retrieval Failed", "total_score": 0})
+        if len(startup_list) > PRESCREEN_TOP_K:
+            print(f"[bold blue]=== 🔎 사전 선별: {len(startup_list)}개 중 상위 {PRESCREEN_TOP_K}개만 상세 평가 ===[/]")
+            startup_list = [name for name, _ in prescreen(startup_list)[:PRESCREEN_TOP_K]]
+
+        print(f"[bold blue]=== ✨ 2단계: 총 {len(startup_list)}개 스타트업 병렬 상세 평가 시작 (동시 {EVAL_MAX_WORKERS}개) ===[/]")
+
+        # [💡] 스타트업별 검색 + AI 평가는 서로 독립적인 네트워크 대기 작업이므로 동시에 실행
+        all_evaluations = asyncio.run(evaluate_all_startups(startup_list))
+
+        for i, (selected_startup, evaluation_result) in enumerate(zip(startup_list, all_evaluations)):
+            print("\n" + "-"*50)
+            print(f"  [bold green]📊 ({i+1}/{len(startup_list)}) 평가 결과: {selected_startup} 📊[/]")
+            if evaluation_result.get("error") == "Context Retrieval Failed":
+                print("  ❌ 컨텍스트 검색 실패 또는 정보 부족으로 평가를 건너뛰었습니다.")
+            elif "error" in evaluation_result:
+                print("  ❌ 평가 결과를 생성하지 못했습니다.")
             else:
-                evaluation_result = evaluate_startup_with_ai(
-                    selected_startup, startup_context, EVALUATION_CRITERIA
-                )
-
-                print("\n" + "-"*50)
-                print(f"  [bold green]📊 ({i+1}/{len(startup_list)}) 평가 결과: {selected_startup} 📊[/]")
-                if evaluation_result:
-                    print(json.dumps(evaluation_result, indent=2, ensure_ascii=False))
-
-                    total_score = 0
-                    if evaluation_result.get("evaluation_summary"):
-                        for category_data in evaluation_result["evaluation_summary"].values():
-                            total_score += category_data.get("score", 0)
-                    evaluation_result["total_score"] = total_score
-                    all_evaluations.append(evaluation_result)
-                    print(f"  [bold yellow]✨ 총점: {total_score} / 30 ✨[/]")
-
-                else:
-                    print("  ❌ 평가 결과를 생성하지 못했습니다.")
-                    all_evaluations.append({"startup_name": selected_startup, "error": "Evaluation Failed", "total_score": 0})
-                print("-"*50)
-
-            # API 호출 속도 조절 (예: 0.5초 대기)
-            # print("  ⏳ 다음 평가까지 0.5초 대기...")
-            # time.sleep(0.5)
+                print(json.dumps(evaluation_result, indent=2, ensure_ascii=False))
+                print(f"  [bold yellow]✨ 총점: {evaluation_result['total_score']} / 30 ✨[/]")
+            print("-"*50)
 
     print("\n[bold magenta]=== 🏁 모든 스타트업 평가 완료 ===[/]")
 
@@ -320,20 +786,21 @@ if __name__ == "__main__":
     if not all_evaluations:
         print("❌ 평가된 스타트업이 없어 결과를 저장할 수 없습니다.")
     else:
-        # 총점(total_score) 기준으로 내림차순 정렬
-        sorted_evaluations = sorted(all_evaluations, key=lambda x: x.get("total_score", 0), reverse=True)
+        # [💡💡💡] 평가 결과를 한 번에 DataFrame으로 펼친 뒤 오류가 없는 결과의 이름과 총점만 추출
+        df_results = pd.json_normalize(all_evaluations, sep="_")
+        if "error" in df_results:
+            df_results = df_results[df_results["error"].isna()] # 오류가 없는 결과만 포함
 
-        # [💡💡💡] 이름과 총점만 추출하여 DataFrame 생성
-        ranked_data = [
-            {"startup_name": item.get("startup_name"), "total_score": item.get("total_score", 0)}
-            for item in sorted_evaluations if "error" not in item # 오류가 없는 결과만 포함
-        ]
-
-        if not ranked_data:
+        if df_results.empty:
              print(f"❌ 유효한 평가 결과가 없어 {RANKED_CSV_FILE} 파일을 생성하지 않습니다.")
         else:
             try:
-                df_ranked = pd.DataFrame(ranked_data)
+                # 총점(total_score) 기준으로 내림차순 정렬 (동점은 평가 순서 유지)
+                df_ranked = (
+                    df_results.reindex(columns=["startup_name", "total_score"])
+                    .sort_values("total_score", ascending=False, kind="stable")
+                    .reset_index(drop=True)
+                )
                 # CSV 파일로 저장 (이름, 점수만)
                 df_ranked.to_csv(RANKED_CSV_FILE, index=False, encoding="utf-8-sig")
                 print(f"✅ 총 {len(df_ranked)}개 스타트업의 이름과 점수를 순위대로 {RANKED_CSV_FILE}에 저장했습니다.")
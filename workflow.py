@@ -0,0 +1,231 @@
+"""
+workflow.py
+투자 심사 워크플로우 구성 및 실행 (병렬/순차/통합 평가 그래프 공용 모듈)
+"""
+import os
+import asyncio
+from functools import lru_cache
+from typing import List
+from langgraph.graph import StateGraph, END, START
+from langgraph.constants import Send
+from agents.base import AgentState, arun_workflow, aclose_async_client
+from agents.eval_agent import technology_agent, learning_effectiveness_agent, growth_potential_agent
+from agents.market_agent import market_agent
+from agents.competition_agent import competition_agent
+from agents.risk_agent import risk_agent
+from agents.judge_agent import comprehensive_judge_agent
+from agents.report_agent import report_generation_agent
+from agents.evaluate_all_agent import evaluate_all_agent
+from agents.quick_score_agent import quick_score_agent
+
+
+def start_node(state: AgentState) -> dict:
+    """시작 노드 - 병렬 실행을 위한 진입점"""
+    print("\n🚀 분석 시작 - 6개 Agent 병렬 실행 준비")
+    print("-" * 70)
+    # LangGraph는 노드가 최소 한 개의 키를 써야 하므로 startup_name을 그대로 전달
+    # (keep_first_value reducer라 값은 바뀌지 않음)
+    return {"startup_name": state["startup_name"]}
+
+
+# 빠른 스크리닝 통과 기준 (quick_score가 이보다 낮으면 전체 분석 없이 '보류')
+QUICK_SCREEN_THRESHOLD = int(os.getenv("QUICK_SCREEN_THRESHOLD", "40"))
+
+
+def screened_out_node(state: AgentState) -> dict:
+    """스크리닝 탈락 - 6개 분석 Agent/보고서 없이 '보류'로 종료"""
+    print(f"\n⏭️ 스크리닝 점수 {state['quick_score']} < {QUICK_SCREEN_THRESHOLD} - 전체 분석 생략 (보류)")
+    return {"final_judge": "보류"}
+
+
+def _add_screening(workflow: StateGraph, entry: str) -> None:
+    """
+    전체 분석 앞에 빠른 스크리닝 단계 추가
+    START → quick_screen → (통과) entry / (탈락) screened_out → END
+    """
+    workflow.add_node("quick_screen", quick_score_agent)
+    workflow.add_node("screened_out", screened_out_node)
+    
+    def route(state: AgentState) -> str:
+        # 점수가 없으면(스크리닝 실패, 점수 파싱 실패) 탈락시키지 않고 전체 분석 진행
+        quick_score = state.get("quick_score")
+        if not quick_score or quick_score >= QUICK_SCREEN_THRESHOLD:
+            return entry
+        return "screened_out"
+    
+    workflow.add_edge(START, "quick_screen")
+    workflow.add_conditional_edges("quick_screen", route, [entry, "screened_out"])
+    workflow.add_edge("screened_out", END)
+
+
+def _add_entry(workflow: StateGraph, entry: str, screen: bool) -> None:
+    """그래프 진입점 연결 (screen=True면 빠른 스크리닝을 거쳐 진입)"""
+    if screen:
+        _add_screening(workflow, entry)
+    else:
+        workflow.add_edge(START, entry)
+
+
+# 병렬로 실행할 분석 Agent 노드 목록
+PARALLEL_AGENTS = ["technology", "learning", "market", "competition", "growth", "risk"]
+
+
+def fan_out(state: AgentState) -> List[Send]:
+    """
+    6개 분석 Agent에 State를 각각 Send로 전달
+    Send로 보낸 노드들은 같은 superstep에서 동시에 실행됨
+    """
+    return [Send(agent, state) for agent in PARALLEL_AGENTS]
+
+
+def _build_parallel_workflow(screen: bool = False):
+    """
+    병렬 Agent 기반 워크플로우 (Fan-out & Fan-in)
+    
+    구조:
+    START → (quick_screen) → start → [6개 분석 Agent 병렬 실행] → Judge → Report → END
+    """
+    
+    workflow = StateGraph(AgentState)
+    
+    # 노드 추가
+    workflow.add_node("start", start_node)
+    workflow.add_node("technology", technology_agent)
+    workflow.add_node("learning", learning_effectiveness_agent)
+    workflow.add_node("market", market_agent)
+    workflow.add_node("competition", competition_agent)
+    workflow.add_node("growth", growth_potential_agent)
+    workflow.add_node("risk", risk_agent)
+    workflow.add_node("judge", comprehensive_judge_agent)
+    workflow.add_node("write_report", report_generation_agent)
+    
+    # ========================================
+    # Fan-out: start → 6개 Agent 병렬 분기
+    # ========================================
+    _add_entry(workflow, "start", screen)
+    
+    # start 노드에서 6개 agent로 Send 분기 (모두 병렬 실행)
+    workflow.add_conditional_edges(
+        "start",
+        fan_out,
+        PARALLEL_AGENTS,  # 가능한 경로 목록
+    )
+    
+    # ========================================
+    # Fan-in: 모든 병렬 Agent → Judge로 수렴
+    # ========================================
+    for agent in PARALLEL_AGENTS:
+        workflow.add_edge(agent, "judge")
+    
+    # ========================================
+    # 순차 실행: Judge → Report → END
+    # ========================================
+    workflow.add_edge("judge", "write_report")
+    workflow.add_edge("write_report", END)
+    
+    return workflow.compile()
+
+
+def _build_sequential_workflow(screen: bool = False):
+    """
+    순차 실행 워크플로우 (성능 비교용)
+    
+    구조:
+    START → (quick_screen) → 6개 분석 Agent 순서대로 → Judge → Report → END
+    """
+    workflow = StateGraph(AgentState)
+    workflow.add_node("technology", technology_agent)
+    workflow.add_node("learning", learning_effectiveness_agent)
+    workflow.add_node("market", market_agent)
+    workflow.add_node("competition", competition_agent)
+    workflow.add_node("growth", growth_potential_agent)
+    workflow.add_node("risk", risk_agent)
+    workflow.add_node("judge", comprehensive_judge_agent)
+    workflow.add_node("write_report", report_generation_agent)
+    
+    _add_entry(workflow, "technology", screen)
+    workflow.add_edge("technology", "learning")
+    workflow.add_edge("learning", "market")
+    workflow.add_edge("market", "competition")
+    workflow.add_edge("competition", "growth")
+    workflow.add_edge("growth", "risk")
+    workflow.add_edge("risk", "judge")
+    workflow.add_edge("judge", "write_report")
+    workflow.add_edge("write_report", END)
+    return workflow.compile()
+
+
+@lru_cache(maxsize=4)
+def build_workflow(parallel: bool = True, screen: bool = False):
+    """
+    분석 Agent 워크플로우 (parallel=False면 순차 실행, 컴파일 결과는 프로세스 내 재사용)
+    screen=True면 빠른 스크리닝을 통과한 경우에만 전체 분석 수행
+    """
+    return _build_parallel_workflow(screen) if parallel else _build_sequential_workflow(screen)
+
+
+@lru_cache(maxsize=2)
+def build_batch_workflow(screen: bool = False):
+    """
+    통합 평가 워크플로우 구축 (6개 영역을 한 번의 LLM 호출로 평가)
+    
+    구조:
+    START → (quick_screen) → evaluate_all → Judge → Report → END
+    """
+    workflow = StateGraph(AgentState)
+    
+    workflow.add_node("evaluate_all", evaluate_all_agent)
+    workflow.add_node("judge", comprehensive_judge_agent)
+    workflow.add_node("write_report", report_generation_agent)
+    
+    _add_entry(workflow, "evaluate_all", screen)
+    workflow.add_edge("evaluate_all", "judge")
+    workflow.add_edge("judge", "write_report")
+    workflow.add_edge("write_report", END)
+    
+    return workflow.compile()
+
+
+async def arun(startup_name: str, parallel: bool = True, batch: bool = False) -> AgentState:
+    """
+    워크플로우 실행 - 이벤트 루프 안에서 호출
+    batch=True면 통합 평가 그래프, 아니면 parallel 여부에 따라 병렬/순차 그래프 사용
+    """
+    # 초기 State (나머지 필드는 각 Agent가 채움 - AgentState는 total=False)
+    initial_state: AgentState = {"startup_name": startup_name}
+    agent = build_batch_workflow() if batch else build_workflow(parallel)
+    return await arun_workflow(agent, initial_state)
+
+
+# 여러 스타트업을 동시에 분석할 때 최대 동시 실행 수 (LLM 호출 수는 llm_semaphore가 별도로 제한)
+MAX_CONCURRENT_STARTUPS = int(os.getenv("MAX_CONCURRENT_STARTUPS", "4"))
+
+
+async def arun_many(
+    startup_names: List[str],
+    parallel: bool = True,
+    batch: bool = False,
+    max_concurrency: int = MAX_CONCURRENT_STARTUPS,
+    screen: bool = True,
+) -> List[AgentState]:
+    """
+    여러 스타트업을 동시에 분석 (스타트업끼리는 서로 독립적, 입력 순서대로 결과 반환)
+    screen=True면 빠른 스크리닝에서 탈락한 스타트업은 전체 분석 없이 '보류' (보고서 없음)
+    공유 HTTP 클라이언트를 모든 실행이 함께 쓰므로 정리는 전부 끝난 뒤 한 번만 수행
+    """
+    agent = build_batch_workflow(screen) if batch else build_workflow(parallel, screen)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def run_one(startup_name: str) -> AgentState:
+        async with semaphore:
+            return await agent.ainvoke({"startup_name": startup_name})
+    
+    try:
+        return await asyncio.gather(*(run_one(name) for name in startup_names))
+    finally:
+        await aclose_async_client()
+
+
+def run(startup_name: str, parallel: bool = True, batch: bool = False) -> AgentState:
+    """워크플로우 실행 (동기 진입점)"""
+    return asyncio.run(arun(startup_name, parallel, batch))